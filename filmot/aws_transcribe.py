@@ -14,6 +14,7 @@ import json
 try:
     import boto3
     import requests
+    from botocore.config import Config
     HAS_BOTO3 = True
 except ImportError:
     HAS_BOTO3 = False
@@ -281,11 +282,12 @@ def wait_for_transcription(
     Raises:
         AWSTranscribeError: If job fails or times out
     """
-    start_time = time.time()
+    # Polled by hand rather than with the boto3 waiter so callback can
+    # report every status change.
+    deadline = time.monotonic() + timeout
     
     while True:
-        elapsed = time.time() - start_time
-        if elapsed > timeout:
+        if time.monotonic() > deadline:
             raise AWSTranscribeError(f"Transcription timed out after {timeout} seconds")
         
         response = transcribe_client.get_transcription_job(TranscriptionJobName=job_name)
@@ -387,8 +389,15 @@ def transcribe_video(
     # Initialize AWS clients
     progress("init", "Initializing AWS clients...")
     session = boto3.Session(profile_name=aws_profile)
-    s3_client = session.client('s3', region_name=aws_region)
-    transcribe_client = session.client('transcribe', region_name=aws_region)
+    # Keep-alive holds the connection open across the status polls; adaptive
+    # retries absorb throttling on get_transcription_job.
+    client_config = Config(
+        tcp_keepalive=True,
+        connect_timeout=5,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    )
+    s3_client = session.client('s3', region_name=aws_region, config=client_config)
+    transcribe_client = session.client('transcribe', region_name=aws_region, config=client_config)
     
     mp3_path = None
     job_name = None
@@ -20,7 +20,7 @@ class Cache:
         """
         self.cache_dir = Path(cache_dir)
         self.ttl = ttl
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._auto_purge()
     
     def _auto_purge(self) -> None:
@@ -60,6 +60,20 @@ class Cache:
         Returns:
             Cached data if valid, None otherwise
         """
+        entry = self.get_entry(endpoint, params)
+        return entry.get("data") if entry is not None else None
+    
+    def get_entry(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the full cache entry (data plus its "timestamp") if valid.
+        
+        Args:
+            endpoint: API endpoint
+            params: Request parameters
+            
+        Returns:
+            Cache entry dict if valid, None otherwise
+        """
         cache_key = self._get_cache_key(endpoint, params)
         cache_path = self._get_cache_path(cache_key)
         
@@ -75,7 +89,7 @@ class Cache:
                 cache_path.unlink()  # Delete expired cache
                 return None
             
-            return cached.get("data")
+            return cached
         except (json.JSONDecodeError, IOError):
             return None
     
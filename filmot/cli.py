@@ -965,14 +965,20 @@ def interactive():
 def cache(clear: bool, clear_expired: bool):
     """Manage the response cache."""
     from .cache import get_cache
+    from .youtube_search import YOUTUBE_CACHE_TTL, get_metadata_cache
     
     cache_instance = get_cache()
+    yt_cache = get_metadata_cache()
     
     if clear:
         count = cache_instance.clear()
+        if yt_cache is not None:
+            count += yt_cache.clear()
         console.print(f"[green]✓ Cleared {count} cache entries[/green]")
     elif clear_expired:
         count = cache_instance.clear_expired()
+        if yt_cache is not None:
+            count += yt_cache.clear_expired()
         console.print(f"[green]✓ Cleared {count} expired entries[/green]")
     else:
         stats = cache_instance.stats()
@@ -986,6 +992,11 @@ def cache(clear: bool, clear_expired: bool):
         table.add_row("Size", f"{stats['size_mb']} MB")
         table.add_row("TTL", f"{stats['ttl_seconds']} seconds")
         table.add_row("Directory", stats["cache_dir"])
+        if yt_cache is not None:
+            yt_stats = yt_cache.stats()
+            table.add_row("YouTube API Entries", str(yt_stats["valid_entries"]))
+            table.add_row("YouTube API Size", f"{yt_stats['size_mb']} MB")
+            table.add_row("YouTube API TTL", f"{YOUTUBE_CACHE_TTL} seconds")
         
         console.print(table)
 
@@ -1184,29 +1195,33 @@ def watchlist_list(unwatched: bool, tag: str):
 
 
 @watchlist.command("add")
-@click.argument("video_id")
-@click.option("--notes", "-n", default="", help="Notes about the video")
-def watchlist_add(video_id: str, notes: str):
-    """Add a video to watchlist by ID."""
+@click.argument("video_ids", nargs=-1, required=True)
+@click.option("--notes", "-n", default="", help="Notes about the video(s)")
+def watchlist_add(video_ids: tuple, notes: str):
+    """Add one or more videos to watchlist by ID."""
     from .watchlist import get_watchlist
     
-    # Fetch video info first
     client = FilmotClient()
-    with console.status(f"[bold green]Fetching video info..."):
-        result = client.get_videos(video_id)
-    
-    if "error" in result or not result:
-        console.print(f"[red]Could not fetch video: {video_id}[/red]")
-        return
-    
-    video = result[0] if isinstance(result, list) else result
-    video["id"] = video_id  # Ensure ID is set
-    
     wl = get_watchlist()
-    if wl.add_video(video, notes):
-        console.print(f"[green]✓ Added: {video.get('title', video_id)}[/green]")
-    else:
-        console.print("[yellow]Video already in watchlist.[/yellow]")
+    
+    # One watchlist write for the whole set, however many IDs are given
+    with wl.batch():
+        for video_id in video_ids:
+            # Fetch video info first
+            with console.status(f"[bold green]Fetching video info for {video_id}..."):
+                result = client.get_videos(video_id)
+            
+            if "error" in result or not result:
+                console.print(f"[red]Could not fetch video: {video_id}[/red]")
+                continue
+            
+            video = result[0] if isinstance(result, list) else result
+            video["id"] = video_id  # Ensure ID is set
+            
+            if wl.add_video(video, notes):
+                console.print(f"[green]✓ Added: {video.get('title', video_id)}[/green]")
+            else:
+                console.print(f"[yellow]Already in watchlist: {video_id}[/yellow]")
 
 
 @watchlist.command("remove")
@@ -1641,7 +1656,7 @@ def transcript_search(video_id: str, query: str, context: int, lang: str):
 @cli.command("yt-search")
 @click.argument("query")
 @click.option("--days", "-d", default=7, type=int, help="Search videos from last N days (default: 7)")
-@click.option("--max-results", "-n", default=25, type=int, help="Maximum results (default: 25, max: 50)")
+@click.option("--max-results", "-n", default=25, type=int, help="Maximum results (default: 25; each 50 beyond the first page costs another search call)")
 @click.option("--order", "-o", default="date", 
               type=click.Choice(["date", "relevance", "viewCount", "rating", "title"]), 
               help="Sort order")
@@ -2157,7 +2172,7 @@ def library_compare(query: str, topic: str, context_chars: int, sort_by: str):
             transcript = data.get("transcript", "")
             import re as _re
             pattern = _re.compile(r'\b' + _re.escape(query.lower()) + r'\b')
-            matches = lib._find_matches(transcript, query.lower(), context_chars=context_chars, pattern=pattern, min_gap=context_chars)
+            matches = lib._find_matches(transcript, query.lower(), context_chars=context_chars, pattern=pattern, min_gap=context_chars, max_matches=3)
             for match in matches[:3]:
                 # Highlight the query term
                 highlighted = match
@@ -3377,12 +3392,17 @@ def proxy_status(full: bool):
         else "never"
     )
 
+    source_line = (
+        f"[bold]Source:[/bold]   {snap['source']} ({snap['total']} proxy URLs)\n"
+        if snap["source"]
+        else f"[bold]Gateway:[/bold]  {snap['gateway']}\n"
+    )
     console.print(Panel(
-        f"[bold]Gateway:[/bold]  {snap['gateway']}\n"
+        source_line +
         f"[bold]Countries:[/bold] {', '.join(snap['countries']) if snap['countries'] else 'all'}\n"
         f"[bold]Sessions:[/bold] {snap['healthy']} healthy / {snap['total']} total\n"
         f"[bold]Last refresh:[/bold] {last_refresh}{' [yellow](stale)[/yellow]' if snap['stale'] else ''}",
-        title="Webshare Proxy Pool",
+        title="Proxy Pool" if snap["source"] else "Webshare Proxy Pool",
         border_style="cyan",
     ))
 
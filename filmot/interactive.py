@@ -7,6 +7,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.markdown import Markdown
+from rich.text import Text
 
 from .api import FilmotClient
 from .watchlist import get_watchlist
@@ -16,6 +17,10 @@ from .cache import get_cache
 
 console = Console()
 
+# Built once; hit lines are assembled from Text spans instead of markup
+# strings so Rich never has to re-parse subtitle text for tags.
+_ELLIPSIS = Text("...")
+
 
 class FilmotREPL(cmd.Cmd):
     """Interactive command-line interface for Filmot."""
@@ -47,6 +52,28 @@ class FilmotREPL(cmd.Cmd):
             "sort": None,
             "order": None
         }
+        
+        # Command name -> bound handler, resolved once instead of per line
+        self._dispatch = {
+            name[3:]: getattr(self, name)
+            for name in self.get_names()
+            if name.startswith("do_")
+        }
+    
+    def onecmd(self, line: str):
+        """Dispatch a line straight through the command table."""
+        line = line.strip()
+        if not line:
+            return self.emptyline()
+        if line[0] == "?":
+            line = "help " + line[1:]
+        
+        parts = line.split(None, 1)
+        handler = self._dispatch.get(parts[0])
+        self.lastcmd = "" if line == "EOF" else line
+        if handler is None:
+            return self.default(line)
+        return handler(parts[1] if len(parts) > 1 else "")
     
     def default(self, line: str):
         """Handle unknown commands as search queries."""
@@ -137,8 +164,8 @@ class FilmotREPL(cmd.Cmd):
             
             table.add_row(
                 str(i),
-                video.get("title", "")[:50],
-                video.get("channelname", "")[:20],
+                Text(video.get("title", "")[:50]),
+                Text(video.get("channelname", "")[:20]),
                 views_str,
                 str(len(video.get("hits", [])))
             )
@@ -187,14 +214,24 @@ class FilmotREPL(cmd.Cmd):
                 start = hit.get("start", 0)
                 mins, secs = divmod(int(start), 60)
                 
+                prefix = f"  [{mins}:{secs:02d}] "
+                
                 lines = hit.get("lines", [])
                 if lines:
                     for line in lines[:3]:
-                        console.print(f"  [{mins}:{secs:02d}] {line.get('text', '')}")
+                        console.print(Text(prefix + line.get("text", "")))
                 else:
-                    token = hit.get("token", "")
-                    ctx = f"{hit.get('ctx_before', '')} [bold yellow]{token}[/bold yellow] {hit.get('ctx_after', '')}"
-                    console.print(f"  [{mins}:{secs:02d}] ...{ctx}...")
+                    body = Text.assemble(
+                        prefix,
+                        _ELLIPSIS,
+                        hit.get("ctx_before", ""),
+                        " ",
+                        (hit.get("token", ""), "bold yellow"),
+                        " ",
+                        hit.get("ctx_after", ""),
+                        _ELLIPSIS,
+                    )
+                    console.print(body)
             
             if len(hits) > 10:
                 console.print(f"  [dim]... and {len(hits) - 10} more matches[/dim]")
@@ -9,33 +9,64 @@ Structure:
         transcripts/
             prompt-injection/
                 rAEqP9VEhe8.json
-                -O1bjFPgRQM.json
+                -O1bjFPgRQM.json.zst  (zstd-compressed, see FILMOT_LIBRARY_COMPRESS)
             quantum-computing/
                 ...
             _index.json  (optional: metadata about all transcripts)
 """
 
+import io
 import json
 import os
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Tuple
 from datetime import datetime
 
+try:
+    import zstandard as zstd
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_JSON_SUFFIX = ".json"
+_ZSTD_SUFFIX = ".json.zst"
+_ZSTD_LEVEL = 3
+
+# Opt-in: write new transcripts zstd-compressed (needs the zstandard package).
+_COMPRESS_DEFAULT = os.getenv("FILMOT_LIBRARY_COMPRESS", "0").strip().lower() in ("1", "true", "yes")
+
 
 class TranscriptLibrary:
     """Manage a local library of YouTube transcripts organized by topic."""
     
-    def __init__(self, data_dir: str = ".filmot_data"):
+    def __init__(self, data_dir: str = ".filmot_data", compress: Optional[bool] = None):
         """
         Initialize the library.
         
         Args:
             data_dir: Base directory for all filmot data
+            compress: Write new transcripts as zstd-compressed ``.json.zst``
+                      files (default: ``FILMOT_LIBRARY_COMPRESS``). Ignored
+                      without zstandard. Plain ``.json`` is always readable.
         """
         self.data_dir = Path(data_dir)
+        self.compress = (_COMPRESS_DEFAULT if compress is None else compress) and HAS_ZSTD
         self.transcripts_dir = self.data_dir / "transcripts"
         self.transcripts_dir.mkdir(parents=True, exist_ok=True)
+        # safe video ID -> {topic dir name: file path}. Built lazily on the
+        # first cross-topic lookup and kept current by save()/delete(); topic
+        # dirs whose mtime has moved since they were indexed (e.g. written by
+        # another process) are rescanned before each lookup.
+        self._id_to_topic: Optional[Dict[str, Dict[str, Path]]] = None
+        self._topic_mtimes: Dict[str, Optional[int]] = {}
+        self._root_mtime: Optional[int] = None
     
     def _normalize_topic(self, topic: str) -> str:
         """
@@ -61,6 +92,134 @@ class TranscriptLibrary:
         topic_dir.mkdir(parents=True, exist_ok=True)
         return topic_dir
     
+    def _iter_topic_dirs(self) -> Iterator[Path]:
+        """Yield every topic directory (skipping ``_``-prefixed internals)."""
+        for topic_dir in self.transcripts_dir.iterdir():
+            if topic_dir.is_dir() and not topic_dir.name.startswith('_'):
+                yield topic_dir
+    
+    def _transcript_files(self, topic_dir: Path) -> List[Path]:
+        """List transcript files in a topic dir, plain and compressed."""
+        return sorted(
+            p for p in topic_dir.glob("*.json*")
+            if p.name.endswith(_JSON_SUFFIX) or p.name.endswith(_ZSTD_SUFFIX)
+        )
+    
+    @staticmethod
+    def _safe_id_of(file_path: Path) -> str:
+        """Recover the sanitized video ID from a transcript filename."""
+        name = file_path.name
+        suffix = _ZSTD_SUFFIX if name.endswith(_ZSTD_SUFFIX) else _JSON_SUFFIX
+        return name[:-len(suffix)]
+    
+    def _find_file(self, topic_dir: Path, safe_id: str) -> Optional[Path]:
+        """Return the stored file for safe_id in topic_dir, whichever format."""
+        for suffix in (_ZSTD_SUFFIX, _JSON_SUFFIX):
+            file_path = topic_dir / f"{safe_id}{suffix}"
+            if file_path.exists():
+                return file_path
+        return None
+    
+    def _read_file(self, file_path: Path) -> Dict[str, Any]:
+        """Load a transcript file, decompressing ``.json.zst`` on the fly."""
+        if file_path.name.endswith(_ZSTD_SUFFIX):
+            if not HAS_ZSTD:
+                raise IOError(f"zstandard is required to read {file_path}: pip install zstandard")
+            try:
+                with open(file_path, 'rb') as f:
+                    with zstd.ZstdDecompressor().stream_reader(f) as reader:
+                        if HAS_ORJSON:
+                            return orjson.loads(reader.read())
+                        return json.load(io.TextIOWrapper(reader, encoding='utf-8'))
+            except zstd.ZstdError as e:
+                # Surface corrupt archives as IOError so callers skip them
+                # the same way they skip unreadable plain files.
+                raise IOError(f"Corrupt zstd transcript {file_path}: {e}") from e
+        if HAS_ORJSON:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    @staticmethod
+    def _dir_mtime(path: Path) -> Optional[int]:
+        """Return a directory's mtime in ns, or None if it is gone."""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _index_topic(self, topic_name: str) -> None:
+        """(Re)index one topic dir, recording its mtime before listing it."""
+        self._drop_topic(topic_name)
+        topic_dir = self.transcripts_dir / topic_name
+        mtime = self._dir_mtime(topic_dir)
+        if mtime is None:
+            self._topic_mtimes.pop(topic_name, None)
+            return
+        self._topic_mtimes[topic_name] = mtime
+        for file_path in self._transcript_files(topic_dir):
+            # Sorted listing puts .json.zst after .json, matching _find_file.
+            self._id_to_topic.setdefault(self._safe_id_of(file_path), {})[topic_name] = file_path
+    
+    def _drop_topic(self, topic_name: str) -> None:
+        """Remove every index entry pointing into topic_name."""
+        for safe_id in [s for s, topics in self._id_to_topic.items() if topic_name in topics]:
+            self._unindex(safe_id, topic_name)
+    
+    def _ensure_index(self) -> Dict[str, Dict[str, Path]]:
+        """
+        Return the video ID -> topic files index, bringing it up to date.
+        
+        The first call scans the whole library. Later calls stat the
+        transcripts dir and each topic dir once and rescan only those whose
+        mtime changed, so saves and deletes made by other processes show up
+        without probing every topic for the requested ID.
+        """
+        if self._id_to_topic is None:
+            self._id_to_topic = {}
+            self._topic_mtimes = {}
+            self._root_mtime = None
+        root_mtime = self._dir_mtime(self.transcripts_dir)
+        if root_mtime != self._root_mtime:
+            # Topic dirs were added or removed
+            self._root_mtime = root_mtime
+            names = {topic_dir.name for topic_dir in self._iter_topic_dirs()}
+            for name in set(self._topic_mtimes) - names:
+                self._drop_topic(name)
+                del self._topic_mtimes[name]
+            for name in names - set(self._topic_mtimes):
+                self._topic_mtimes[name] = None
+        for name, seen in list(self._topic_mtimes.items()):
+            if self._dir_mtime(self.transcripts_dir / name) != seen:
+                self._index_topic(name)
+        return self._id_to_topic
+    
+    def _topics_for(self, safe_id: str) -> List[Tuple[str, Path]]:
+        """Return ``(topic name, file path)`` for every topic holding safe_id."""
+        return sorted(self._ensure_index().get(safe_id, {}).items())
+    
+    def _unindex(self, safe_id: str, topic_name: str) -> None:
+        """Drop one (video, topic) pair from the index if it has been built."""
+        if self._id_to_topic is None:
+            return
+        topics = self._id_to_topic.get(safe_id)
+        if topics is not None:
+            topics.pop(topic_name, None)
+            if not topics:
+                del self._id_to_topic[safe_id]
+    
+    def _unlink_all(self, topic_dir: Path, safe_id: str) -> bool:
+        """Delete safe_id from topic_dir in either format; True if any existed."""
+        deleted = False
+        for suffix in (_ZSTD_SUFFIX, _JSON_SUFFIX):
+            try:
+                (topic_dir / f"{safe_id}{suffix}").unlink()
+                deleted = True
+            except FileNotFoundError:
+                pass
+        return deleted
+    
     def _sanitize_video_id(self, video_id: str) -> str:
         """
         Sanitize video ID for use as filename.
@@ -91,18 +250,52 @@ class TranscriptLibrary:
         """
         topic_dir = self._get_topic_dir(topic)
         safe_id = self._sanitize_video_id(video_id)
-        file_path = topic_dir / f"{safe_id}.json"
+        mtime_before = self._dir_mtime(topic_dir)
+        suffix = _ZSTD_SUFFIX if self.compress else _JSON_SUFFIX
+        file_path = topic_dir / f"{safe_id}{suffix}"
         
+        topic_normalized = topic_dir.name
         data = {
             "video_id": video_id,
-            "topic": self._normalize_topic(topic),
+            "topic": topic_normalized,
             "saved_at": datetime.now().isoformat(),
             "transcript": transcript_text,
             "metadata": metadata or {},
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write to a temp file and swap it in, so a crash or a concurrent
+        # reader never sees a half-written transcript.
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            if self.compress:
+                if HAS_ORJSON:
+                    payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+                else:
+                    payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+                with open(tmp_path, 'wb') as f:
+                    f.write(zstd.ZstdCompressor(level=_ZSTD_LEVEL).compress(payload))
+            elif HAS_ORJSON:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        # Drop a copy left behind in the other format so there is one per video
+        stale = topic_dir / f"{safe_id}{_JSON_SUFFIX if self.compress else _ZSTD_SUFFIX}"
+        if stale.exists():
+            stale.unlink()
+        
+        if self._id_to_topic is not None:
+            self._id_to_topic.setdefault(safe_id, {})[topic_normalized] = file_path
+            # Our own write needn't trigger a rescan, unless someone else had
+            # already touched the dir since it was indexed.
+            if self._topic_mtimes.get(topic_normalized) == mtime_before:
+                self._topic_mtimes[topic_normalized] = self._dir_mtime(topic_dir)
         
         return file_path
     
@@ -121,25 +314,27 @@ class TranscriptLibrary:
         
         if topic:
             # Look in specific topic
-            file_path = self._get_topic_dir(topic) / f"{safe_id}.json"
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            file_path = self._find_file(self._get_topic_dir(topic), safe_id)
+            if file_path is not None:
+                return self._read_file(file_path)
             return None
         
-        # Search all topics
-        for topic_dir in self.transcripts_dir.iterdir():
-            if topic_dir.is_dir() and not topic_dir.name.startswith('_'):
-                file_path = topic_dir / f"{safe_id}.json"
-                if file_path.exists():
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+        # Search all topics via the index
+        for topic_name, file_path in self._topics_for(safe_id):
+            try:
+                return self._read_file(file_path)
+            except FileNotFoundError:
+                # Removed since the last rescan (same mtime tick)
+                self._unindex(safe_id, topic_name)
         
         return None
     
     def exists(self, video_id: str, topic: Optional[str] = None) -> bool:
         """Check if a transcript exists in the library."""
-        return self.get(video_id, topic) is not None
+        safe_id = self._sanitize_video_id(video_id)
+        if topic:
+            return self._find_file(self._get_topic_dir(topic), safe_id) is not None
+        return bool(self._topics_for(safe_id))
     
     def list_topics(self) -> List[Dict[str, Any]]:
         """
@@ -148,17 +343,19 @@ class TranscriptLibrary:
         Returns:
             List of dicts with topic name and transcript count
         """
-        topics = []
-        for topic_dir in sorted(self.transcripts_dir.iterdir()):
-            if topic_dir.is_dir() and not topic_dir.name.startswith('_'):
-                count = len(list(topic_dir.glob("*.json")))
-                if count > 0:
-                    topics.append({
-                        "topic": topic_dir.name,
-                        "count": count,
-                        "path": str(topic_dir),
-                    })
-        return topics
+        return [topic for topic, _ in self._scan_topics()]
+    
+    def _scan_topics(self) -> Iterator[Tuple[Dict[str, Any], List[Path]]]:
+        """Yield (list_topics entry, transcript files) for each non-empty topic."""
+        for topic_dir in sorted(self._iter_topic_dirs()):
+            files = self._transcript_files(topic_dir)
+            if files:
+                topic = {
+                    "topic": topic_dir.name,
+                    "count": len(files),
+                    "path": str(topic_dir),
+                }
+                yield topic, files
     
     def list_transcripts(self, topic: str) -> List[Dict[str, Any]]:
         """
@@ -173,10 +370,9 @@ class TranscriptLibrary:
         topic_dir = self._get_topic_dir(topic)
         transcripts = []
         
-        for file_path in sorted(topic_dir.glob("*.json")):
+        for file_path in self._transcript_files(topic_dir):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = self._read_file(file_path)
                 transcripts.append({
                     "video_id": data.get("video_id"),
                     "saved_at": data.get("saved_at"),
@@ -207,9 +403,10 @@ class TranscriptLibrary:
         """
         query_lower = query.lower()
 
-        # Build regex pattern with word boundaries (default) or substring
-        if substring:
-            pattern = re.compile(re.escape(query_lower))
+        # Build regex pattern with word boundaries (default). Substring and
+        # single-word queries skip the regex and take the str.find path.
+        if substring or query_lower.isalnum():
+            pattern = None
         else:
             # Lookarounds instead of \b so queries ending in non-word chars
             # (e.g. "c++", ".net") still match as whole words
@@ -221,30 +418,34 @@ class TranscriptLibrary:
         if topic:
             topics_to_search = [self._normalize_topic(topic)]
         else:
-            topics_to_search = [d.name for d in self.transcripts_dir.iterdir()
-                               if d.is_dir() and not d.name.startswith('_')]
+            topics_to_search = [d.name for d in self._iter_topic_dirs()]
 
         for topic_name in topics_to_search:
             topic_dir = self.transcripts_dir / topic_name
             if not topic_dir.exists():
                 continue
 
-            for file_path in topic_dir.glob("*.json"):
+            for file_path in self._transcript_files(topic_dir):
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = self._read_file(file_path)
 
                     transcript = data.get("transcript", "")
-                    if pattern.search(transcript.lower()):
-                        # Find match positions and extract context
-                        matches = self._find_matches(transcript, query_lower, pattern=pattern)
+                    # Count every match, but only cut context for the first 5
+                    match_count = 0
+                    matches = []
+                    spans = self._match_spans(transcript.lower(), query_lower, pattern, whole_word=not substring)
+                    for pos, match_end in spans:
+                        match_count += 1
+                        if match_count <= 5:
+                            matches.append(self._match_context(transcript, pos, match_end))
+                    if match_count:
                         results.append({
                             "video_id": data.get("video_id"),
                             "topic": topic_name,
                             "title": data.get("metadata", {}).get("title", "Unknown"),
                             "channel": data.get("metadata", {}).get("channel", "Unknown"),
-                            "match_count": len(matches),
-                            "matches": matches[:5],  # First 5 matches with context
+                            "match_count": match_count,
+                            "matches": matches,  # First 5 matches with context
                         })
                 except (json.JSONDecodeError, IOError):
                     continue
@@ -253,44 +454,86 @@ class TranscriptLibrary:
         results.sort(key=lambda x: x["match_count"], reverse=True)
         return results
 
-    def _find_matches(self, text: str, query: str, context_chars: int = 100, pattern=None, min_gap: int = 0) -> List[str]:
+    def _find_matches(self, text: str, query: str, context_chars: int = 100, pattern=None, min_gap: int = 0,
+                      max_matches: Optional[int] = None) -> List[str]:
         """Find all occurrences of query in text with surrounding context.
 
         Args:
             min_gap: Minimum character gap between displayed matches to avoid
                      overlapping context windows. When > 0, skips matches that
                      fall within min_gap chars of the previous kept match.
+            max_matches: Stop scanning once this many contexts are collected.
         """
         matches = []
         text_lower = text.lower()
 
-        if pattern is None:
-            pattern = re.compile(r'\b' + re.escape(query) + r'\b')
-
         last_pos = -(min_gap + 1)  # Ensure first match is always included
-        for m in pattern.finditer(text_lower):
-            pos = m.start()
-
+        for pos, match_end in self._match_spans(text_lower, query, pattern):
             # Skip matches whose context would overlap with the previous one
             if min_gap > 0 and (pos - last_pos) < min_gap:
                 continue
             last_pos = pos
 
-            query_len = m.end() - m.start()
+            matches.append(self._match_context(text, pos, match_end, context_chars))
+            if max_matches is not None and len(matches) >= max_matches:
+                break
+
+        return matches
 
-            # Extract context around match
-            start = max(0, pos - context_chars)
-            end = min(len(text), pos + query_len + context_chars)
+    def _match_context(self, text: str, pos: int, match_end: int, context_chars: int = 100) -> str:
+        """Cut the context window around one match, with ellipses at cut edges."""
+        start = max(0, pos - context_chars)
+        end = min(len(text), match_end + context_chars)
 
-            context = text[start:end]
-            if start > 0:
-                context = "..." + context
-            if end < len(text):
-                context = context + "..."
+        context = text[start:end]
+        if start > 0:
+            context = "..." + context
+        if end < len(text):
+            context = context + "..."
+        return context
 
-            matches.append(context)
+    def _match_spans(self, text_lower: str, query: str, pattern=None,
+                     whole_word: bool = True) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) spans of whole-word query matches in text_lower.
 
-        return matches
+        With no pattern, alphanumeric queries are located with str.find plus
+        a neighbour check instead of the regex engine; anything else falls
+        back to a word-boundary regex. With whole_word=False every
+        non-overlapping occurrence is yielded, also via str.find.
+        """
+        if pattern is not None:
+            for m in pattern.finditer(text_lower):
+                yield m.start(), m.end()
+            return
+
+        if not whole_word:
+            query_len = len(query)
+            find = text_lower.find
+            pos = find(query)
+            while pos != -1:
+                yield pos, pos + query_len
+                pos = find(query, pos + (query_len or 1))
+            return
+
+        if not query.isalnum():
+            for m in re.finditer(r'\b' + re.escape(query) + r'\b', text_lower):
+                yield m.start(), m.end()
+            return
+
+        query_len = len(query)
+        text_len = len(text_lower)
+        find = text_lower.find
+        pos = find(query)
+        while pos != -1:
+            end = pos + query_len
+            # Same boundary rule as (?<!\w) / (?!\w)
+            before = text_lower[pos - 1] if pos > 0 else ""
+            after = text_lower[end] if end < text_len else ""
+            if not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_"):
+                yield pos, end
+                pos = find(query, end)
+            else:
+                pos = find(query, pos + 1)
     
     def get_context(self, topic: str, max_chars: Optional[int] = None) -> str:
         """
@@ -305,7 +548,10 @@ class TranscriptLibrary:
         """
         transcripts = self.list_transcripts(topic)
         
-        parts = []
+        # Write straight into one buffer rather than building per-video
+        # header/content strings and joining them at the end.
+        buf = io.StringIO()
+        rule = "=" * 60
         total_chars = 0
         
         for t in transcripts:
@@ -313,27 +559,35 @@ class TranscriptLibrary:
             if not data:
                 continue
             
-            header = f"\n{'='*60}\n"
-            header += f"VIDEO: {data.get('metadata', {}).get('title', t['video_id'])}\n"
-            header += f"CHANNEL: {data.get('metadata', {}).get('channel', 'Unknown')}\n"
-            header += f"ID: {t['video_id']}\n"
-            header += f"{'='*60}\n\n"
-            
+            metadata = data.get("metadata", {})
+            header = (
+                f"\n{rule}\n"
+                f"VIDEO: {metadata.get('title', t['video_id'])}\n"
+                f"CHANNEL: {metadata.get('channel', 'Unknown')}\n"
+                f"ID: {t['video_id']}\n"
+                f"{rule}\n\n"
+            )
             transcript = data.get("transcript", "")
-            content = header + transcript
+            content_len = len(header) + len(transcript)
             
-            if max_chars and total_chars + len(content) > max_chars:
+            if max_chars and total_chars + content_len > max_chars:
                 # Truncate this transcript to fit
                 remaining = max_chars - total_chars
                 if remaining > len(header) + 500:  # At least 500 chars of content
-                    content = content[:remaining] + "\n\n[TRUNCATED]"
-                    parts.append(content)
+                    if buf.tell():
+                        buf.write("\n")
+                    buf.write(header)
+                    buf.write(transcript[:remaining - len(header)])
+                    buf.write("\n\n[TRUNCATED]")
                 break
             
-            parts.append(content)
-            total_chars += len(content)
+            if buf.tell():
+                buf.write("\n")
+            buf.write(header)
+            buf.write(transcript)
+            total_chars += content_len
         
-        return "\n".join(parts)
+        return buf.getvalue()
     
     def delete(self, video_id: str, topic: Optional[str] = None) -> bool:
         """
@@ -350,18 +604,14 @@ class TranscriptLibrary:
         deleted = False
         
         if topic:
-            file_path = self._get_topic_dir(topic) / f"{safe_id}.json"
-            if file_path.exists():
-                file_path.unlink()
-                deleted = True
+            topic_dir = self._get_topic_dir(topic)
+            deleted = self._unlink_all(topic_dir, safe_id)
+            self._unindex(safe_id, topic_dir.name)
         else:
-            # Delete from all topics
-            for topic_dir in self.transcripts_dir.iterdir():
-                if topic_dir.is_dir():
-                    file_path = topic_dir / f"{safe_id}.json"
-                    if file_path.exists():
-                        file_path.unlink()
-                        deleted = True
+            # Delete from every topic the index knows about
+            for topic_name, file_path in self._topics_for(safe_id):
+                deleted = self._unlink_all(file_path.parent, safe_id) or deleted
+            self._ensure_index().pop(safe_id, None)
         
         return deleted
     
@@ -378,9 +628,10 @@ class TranscriptLibrary:
         topic_dir = self._get_topic_dir(topic)
         count = 0
         
-        for file_path in topic_dir.glob("*.json"):
+        for file_path in self._transcript_files(topic_dir):
             file_path.unlink()
             count += 1
+            self._unindex(self._safe_id_of(file_path), topic_dir.name)
         
         # Remove empty directory
         try:
@@ -397,14 +648,13 @@ class TranscriptLibrary:
         Returns:
             Dict with total counts, size, and per-topic breakdown
         """
-        topics = self.list_topics()
-        total_transcripts = sum(t["count"] for t in topics)
+        # One directory listing per topic serves both the counts and sizes
+        topics = []
         total_size = 0
-        
-        for topic_dir in self.transcripts_dir.iterdir():
-            if topic_dir.is_dir():
-                for file_path in topic_dir.glob("*.json"):
-                    total_size += file_path.stat().st_size
+        for topic, files in self._scan_topics():
+            topics.append(topic)
+            total_size += sum(p.stat().st_size for p in files)
+        total_transcripts = sum(t["count"] for t in topics)
         
         return {
             "total_topics": len(topics),
@@ -27,6 +27,7 @@ import time
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Iterable, Optional
+from urllib.parse import urlsplit
 
 import requests
 from dotenv import load_dotenv
@@ -44,6 +45,8 @@ DEFAULT_STATE_PATH = Path(".filmot_data") / "webshare_pool.json"
 # line). Lets the pool rotate across many residential exit IPs without a
 # WEBSHARE_API_TOKEN — each numbered session pins to a distinct exit IP.
 DEFAULT_SESSION_FILE = Path(".filmot_data") / "webshare_info.txt"
+# Health state for a FILMOT_PROXY_POOL list of plain proxy URLs.
+DEFAULT_URL_POOL_STATE_PATH = Path(".filmot_data") / "proxy_pool_urls.json"
 
 # Cooldown windows per failure class (seconds)
 COOLDOWN_RATE_LIMITED = 90
@@ -80,6 +83,9 @@ class WebshareSession:
     last_used_at: float = 0.0
     last_error: Optional[str] = None
     retired: bool = False
+    # Full proxy URL for sessions that don't go through the Webshare gateway.
+    # May embed credentials, so it is never persisted (see to_state()).
+    url: Optional[str] = None
 
     def is_available(self, now: float) -> bool:
         return self.valid and not self.retired and self.cooldown_until <= now
@@ -87,6 +93,17 @@ class WebshareSession:
     def to_dict(self) -> dict:
         return asdict(self)
 
+    def to_state(self) -> dict:
+        """Return the dict written to the state file.
+
+        URL sessions are re-read from FILMOT_PROXY_POOL on every start, so only
+        their credential-free id and health are kept on disk.
+        """
+        data = self.to_dict()
+        if self.url:
+            data["url"] = None
+        return data
+
     @classmethod
     def from_dict(cls, data: dict) -> "WebshareSession":
         # Tolerate missing health fields when loading older snapshots.
@@ -112,6 +129,9 @@ class WebshareProxyPool:
     Thread-safe (uses an internal lock around state mutation).
     """
 
+    # Env var a URL pool was read from; None for Webshare gateway sessions.
+    source: Optional[str] = None
+
     def __init__(
         self,
         token: str,
@@ -143,11 +163,17 @@ class WebshareProxyPool:
 
         self._load_state()
 
-    def _init_file_backed(self, sessions: list, state_path: Optional[Path] = None) -> None:
+    def _init_file_backed(
+        self,
+        sessions: list,
+        state_path: Optional[Path] = None,
+        source: Optional[str] = None,
+    ) -> None:
         """Initialize a token-less pool from a pre-exported session list.
 
         Never calls the Webshare API; rotates across the provided sessions and
         persists health to its own state file (merging prior health by id).
+        ``source`` names where non-gateway sessions came from, for status output.
         """
         self.token = None
         self.countries = []
@@ -162,6 +188,7 @@ class WebshareProxyPool:
         self._last_refresh = time.time()
         self._cursor = 0
         self._file_backed = True
+        self.source = source
         # Merge prior health stats (cooldowns, retirement) for known sessions.
         try:
             if self.state_path.exists():
@@ -206,7 +233,7 @@ class WebshareProxyPool:
             "gateway_port": self.gateway_port,
             "countries": self.countries,
             "cursor": self._cursor,
-            "sessions": [s.to_dict() for s in self._sessions],
+            "sessions": [s.to_state() for s in self._sessions],
         }
         tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
         tmp.write_text(json.dumps(payload, indent=2))
@@ -315,6 +342,8 @@ class WebshareProxyPool:
         self._api_post("/api/v2/proxy/list/refresh/")
 
     def proxy_url(self, session: WebshareSession) -> str:
+        if session.url:
+            return session.url
         return (
             f"http://{session.username}:{session.password}"
             f"@{self.gateway_host}:{self.gateway_port}"
@@ -411,7 +440,8 @@ class WebshareProxyPool:
                 }
             )
         return {
-            "gateway": f"{self.gateway_host}:{self.gateway_port}",
+            "gateway": None if self.source else f"{self.gateway_host}:{self.gateway_port}",
+            "source": self.source,
             "countries": self.countries,
             "total": len(self._sessions),
             "healthy": self.healthy_count(),
@@ -459,12 +489,42 @@ def _load_sessions_from_file(path: Path, limit: int) -> list[WebshareSession]:
     return [WebshareSession(id=u, username=u, password=p) for u, p in parsed]
 
 
+def _load_sessions_from_urls(raw: str, limit: int) -> list[WebshareSession]:
+    """Parse a comma-separated list of proxy URLs into sessions.
+
+    Session ids are ``host:port`` so credentials never land in status output
+    or the state file; they live only in the URL read from the environment.
+    """
+    sessions: list[WebshareSession] = []
+    seen: set[str] = set()
+    for url in (u.strip() for u in raw.split(",")):
+        if not url:
+            continue
+        if "://" not in url:
+            url = f"http://{url}"
+        parts = urlsplit(url)
+        if not parts.hostname:
+            continue
+        sid = f"{parts.hostname}:{parts.port}" if parts.port else parts.hostname
+        if sid in seen:
+            sid = f"{sid}#{len(sessions)}"
+        seen.add(sid)
+        sessions.append(WebshareSession(
+            id=sid, username="", password="", url=url,
+        ))
+        if len(sessions) >= limit:
+            break
+    return sessions
+
+
 def get_pool(*, force_new: bool = False) -> Optional[WebshareProxyPool]:
     """Return the process-wide pool, or None if no proxy source is configured.
 
-    Two sources, in order of preference:
+    Three sources, in order of preference:
       1. WEBSHARE_API_TOKEN  → live API, health-tracked, can self-refresh.
-      2. A pre-exported session file (WEBSHARE_SESSION_FILE or webshare_info.txt)
+      2. FILMOT_PROXY_POOL   → comma-separated proxy URLs from any provider,
+         rotated and health-tracked the same way.
+      3. A pre-exported session file (WEBSHARE_SESSION_FILE or webshare_info.txt)
          → rotate across many backbone sessions with no API token. This revives
          multi-IP rotation when only proxy credentials (not an API key) exist.
     """
@@ -489,6 +549,16 @@ def get_pool(*, force_new: bool = False) -> Optional[WebshareProxyPool]:
             if _pool is not None:
                 return _pool
 
+        url_list = os.getenv("FILMOT_PROXY_POOL", "")
+        if url_list.strip():
+            sessions = _load_sessions_from_urls(url_list, max_sessions)
+            if sessions:
+                _pool = WebshareProxyPool.__new__(WebshareProxyPool)
+                _pool._init_file_backed(
+                    sessions, DEFAULT_URL_POOL_STATE_PATH, source="FILMOT_PROXY_POOL"
+                )
+                return _pool
+
         # Fall back to a file-backed pool (no API token needed).
         session_file = Path(os.getenv("WEBSHARE_SESSION_FILE", str(DEFAULT_SESSION_FILE)))
         if session_file.exists():
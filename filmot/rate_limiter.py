@@ -3,14 +3,18 @@
 Supports both in-process and cross-process rate limiting via SQLite.
 """
 
+import itertools
 import logging
 import os
 import sqlite3
 import time
 import threading
+from collections import deque
 from pathlib import Path
 from typing import Optional
-from collections import deque
+
+# asyncio is imported inside the coroutine methods: it adds ~20 ms to every
+# CLI start and only async callers need it.
 
 logger = logging.getLogger(__name__)
 
@@ -22,59 +26,140 @@ _DEFAULT_SHARED_DB = Path(os.environ.get(
 
 
 class RateLimiter:
-    """Token bucket rate limiter with sliding window."""
+    """Token bucket rate limiter.
+
+    The bucket is a single float, ``_zero_time``: the instant at which it
+    would be empty. Available tokens are ``(now - _zero_time) * rate``,
+    capped at ``burst_size``, so consuming one is an O(1) update with no
+    per-request history to walk.
+    """
 
     def __init__(self, requests_per_second: float = 1.0, burst_size: int = 5):
         self.requests_per_second = requests_per_second
         self.burst_size = burst_size
         self.min_interval = 1.0 / requests_per_second
-        self.request_times: deque = deque(maxlen=burst_size)
+        # Monotonic so NTP steps or DST changes can't stall or flood the
+        # bucket. SharedRateLimiter keeps wall-clock time for its DB rows,
+        # which other processes have to be able to compare.
+        self._clock = time.monotonic
+        self._zero_time = float("-inf")  # the bucket starts full
         self.lock = threading.Lock()
-        self.total_requests = 0
-        self.total_waits = 0
-        self.total_wait_time = 0.0
+        # Waiters block on this (sharing self.lock) so that backoff changes
+        # can wake them to re-check their deadline instead of oversleeping.
+        self.cond = threading.Condition(self.lock)
+        # Stats are per thread, as [requests, waits, wait_time], and are only
+        # summed when stats() is called. Each list has a single writer, so
+        # updates skip the lock.
+        self._counters: dict = {}
 
     def acquire(self) -> float:
+        return self._acquire(1)
+
+    def acquire_n(self, n: int) -> float:
+        """Reserve ``n`` tokens with one lock acquisition and at most one wait.
+
+        Returns once all ``n`` are available, so the caller may then issue
+        ``n`` requests back to back.
+
+        Raises:
+            ValueError: If ``n`` is less than 1 or larger than ``burst_size``
+                (the bucket can never hold that many at once).
+        """
+        if not 1 <= n <= self.burst_size:
+            raise ValueError(f"n must be between 1 and burst_size ({self.burst_size}), got {n}")
+        return self._acquire(n)
+
+    def _acquire(self, n: int) -> float:
+        # Reserve the tokens in one critical section: clamp the bucket to
+        # burst_size, take n tokens' worth of time off it, then wait on
+        # the condition (which releases the lock) until that reservation
+        # plus any backoff falls due. A deficit simply pushes _zero_time
+        # into the future, which queues callers in arrival order without a
+        # retry loop. The caller's own backoff is re-read on every wakeup.
+        with self.cond:
+            current_time, slot = self._reserve(n)
+            remaining = slot + self._extra_wait() - current_time
+            waited = remaining > 0
+            while remaining > 0:
+                self.cond.wait(timeout=remaining)
+                remaining = slot + self._extra_wait() - self._clock()
+        return self._record(n, current_time if waited else None)
+
+    async def acquire_async(self) -> float:
+        """Coroutine form of acquire() that awaits instead of blocking.
+
+        The reservation is identical; only the wait differs, so many
+        in-flight requests can share one event loop thread. The backoff is
+        re-read after each sleep, but a drop in backoff doesn't cut a sleep
+        short the way it does for threads parked on the condition.
+        """
         with self.lock:
-            current_time = time.time()
-            wait_time = 0.0
-            window_start = current_time - 1.0
-            while self.request_times and self.request_times[0] < window_start:
-                self.request_times.popleft()
-            if len(self.request_times) >= self.burst_size:
-                oldest = self.request_times[0]
-                wait_time = (oldest + 1.0) - current_time
-                if wait_time > 0:
-                    self.total_waits += 1
-                    self.total_wait_time += wait_time
-            if self.request_times:
-                last_request = self.request_times[-1]
-                interval_wait = (last_request + self.min_interval) - current_time
-                if interval_wait > wait_time:
-                    wait_time = interval_wait
-        if wait_time > 0:
-            time.sleep(wait_time)
-        with self.lock:
-            self.request_times.append(time.time())
-            self.total_requests += 1
+            current_time, slot = self._reserve()
+            remaining = slot + self._extra_wait() - current_time
+        import asyncio
+
+        waited = remaining > 0
+        while remaining > 0:
+            await asyncio.sleep(remaining)
+            with self.lock:
+                remaining = slot + self._extra_wait() - self._clock()
+        return self._record(1, current_time if waited else None)
+
+    def _reserve(self, n: int = 1) -> tuple:
+        """Take ``n`` tokens. Caller holds self.lock.
+
+        Returns ``(now, slot)`` where ``slot`` is when the last token falls due.
+        Any backoff also pushes back the bucket for later callers, so the
+        spacing between reservations grows to ``min_interval * backoff``
+        rather than every concurrent caller waiting the same extra amount.
+        """
+        current_time = self._clock()
+        zero_time = max(self._zero_time, current_time - self.burst_size * self.min_interval)
+        zero_time += n * self.min_interval
+        self._zero_time = zero_time + n * self._extra_wait()
+        return current_time, max(zero_time, current_time)
+
+    def _thread_counters(self) -> list:
+        """This thread's ``[requests, waits, wait_time]`` slot."""
+        ident = threading.get_ident()
+        counters = self._counters.get(ident)
+        if counters is None:
+            counters = self._counters.setdefault(ident, [0, 0, 0.0])
+        return counters
+
+    def _record(self, n: int, waited_since: Optional[float] = None) -> float:
+        """Count ``n`` requests and any wait; returns the wait time."""
+        counters = self._thread_counters()
+        counters[0] += n
+        if waited_since is None:
+            return 0.0
+        wait_time = self._clock() - waited_since
+        counters[1] += 1
+        counters[2] += wait_time
         return wait_time
 
+    def _extra_wait(self) -> float:
+        """Additional delay on top of the bucket's own. Caller holds self.lock."""
+        return 0.0
+
     def stats(self) -> dict:
-        with self.lock:
-            return {
-                "total_requests": self.total_requests,
-                "total_waits": self.total_waits,
-                "total_wait_time": round(self.total_wait_time, 2),
-                "avg_wait_time": round(self.total_wait_time / max(self.total_waits, 1), 3),
-                "requests_per_second": self.requests_per_second,
-                "burst_size": self.burst_size,
-            }
+        total_requests = total_waits = 0
+        total_wait_time = 0.0
+        for requests, waits, wait_time in list(self._counters.values()):
+            total_requests += requests
+            total_waits += waits
+            total_wait_time += wait_time
+        return {
+            "total_requests": total_requests,
+            "total_waits": total_waits,
+            "total_wait_time": round(total_wait_time, 2),
+            "avg_wait_time": round(total_wait_time / max(total_waits, 1), 3),
+            "requests_per_second": self.requests_per_second,
+            "burst_size": self.burst_size,
+        }
 
     def reset_stats(self):
-        with self.lock:
-            self.total_requests = 0
-            self.total_waits = 0
-            self.total_wait_time = 0.0
+        self._counters = {}
 
     def report_success(self):
         pass
@@ -93,24 +178,93 @@ class AdaptiveRateLimiter(RateLimiter):
         self.max_backoff = 10.0
 
     def report_success(self):
-        with self.lock:
+        with self.cond:
             self.consecutive_errors = 0
             self.backoff_factor = max(1.0, self.backoff_factor * 0.9)
+            self.cond.notify_all()
 
     def report_rate_limit(self):
-        with self.lock:
+        with self.cond:
             self.consecutive_errors += 1
             self.backoff_factor = min(self.max_backoff, self.backoff_factor * 2)
+            self.cond.notify_all()
 
-    def acquire(self) -> float:
-        base_wait = super().acquire()
-        with self.lock:
-            if self.backoff_factor > 1.0:
-                extra_wait = (self.backoff_factor - 1.0) * self.min_interval
-                if extra_wait > 0:
-                    time.sleep(extra_wait)
-                    return base_wait + extra_wait
-        return base_wait
+    def _extra_wait(self) -> float:
+        return (self.backoff_factor - 1.0) * self.min_interval
+
+
+class CircuitBreaker:
+    """Fail fast while an upstream endpoint keeps failing.
+
+    Opens after ``failure_threshold`` failures within ``window`` seconds and
+    rejects calls for ``reset_timeout`` seconds. After that a single trial
+    call is let through (half-open); its outcome closes or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, window: float = 60.0,
+                 reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self._clock = time.monotonic
+        self._lock = threading.Lock()
+        self._failures: deque = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_pending = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may go out now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_pending = False
+            if self._trial_pending:
+                return False
+            self._trial_pending = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures.clear()
+            self._trial_pending = False
+
+    def record_failure(self):
+        with self._lock:
+            now = self._clock()
+            if self._state == self.HALF_OPEN:
+                self._open(now)
+                return
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window:
+                self._failures.popleft()
+            if len(self._failures) >= self.failure_threshold:
+                self._open(now)
+
+    def reset(self):
+        self.record_success()
+
+    def _open(self, now: float):
+        self._state = self.OPEN
+        self._opened_at = now
+        self._failures.clear()
+        self._trial_pending = False
 
 
 class SharedRateLimiter(RateLimiter):
@@ -127,6 +281,7 @@ class SharedRateLimiter(RateLimiter):
         self.consecutive_errors = 0
         self.backoff_factor = 1.0
         self.max_backoff = 10.0
+        self._cleanup_ticks = itertools.count(1)
         self._db_available = self._init_db()
 
     def _init_db(self) -> bool:
@@ -231,13 +386,13 @@ class SharedRateLimiter(RateLimiter):
             self._record_request(conn)
 
             # Periodic cleanup
-            with self.lock:
-                self.total_requests += 1
-                if self.total_requests % 20 == 0:
-                    self._cleanup_old(conn)
-                if wait_time > 0:
-                    self.total_waits += 1
-                    self.total_wait_time += wait_time
+            if next(self._cleanup_ticks) % 20 == 0:
+                self._cleanup_old(conn)
+            counters = self._thread_counters()
+            counters[0] += 1
+            if wait_time > 0:
+                counters[1] += 1
+                counters[2] += wait_time
 
             conn.close()
         except Exception as e:
@@ -246,6 +401,23 @@ class SharedRateLimiter(RateLimiter):
 
         return wait_time
 
+    def acquire_n(self, n: int) -> float:
+        if not self._db_available:
+            return super().acquire_n(n)
+        if not 1 <= n <= self.burst_size:
+            raise ValueError(f"n must be between 1 and burst_size ({self.burst_size}), got {n}")
+        # Each row in the shared log is one request, so reserve them one by one.
+        return sum(self.acquire() for _ in range(n))
+
+    async def acquire_async(self) -> float:
+        if not self._db_available:
+            return await super().acquire_async()
+        import asyncio
+
+        # The SQLite round-trips block, so run the whole acquire off-loop.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.acquire)
+
     def report_success(self):
         with self.lock:
             self.consecutive_errors = 0
@@ -259,6 +431,12 @@ class SharedRateLimiter(RateLimiter):
 
 # Global rate limiter instance
 _rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+# YouTube Data API quota: units per day, and what each call costs.
+YOUTUBE_DAILY_QUOTA = int(os.environ.get("FILMOT_YOUTUBE_QUOTA", "10000"))
+YOUTUBE_QUOTA_COST = {"search": 100, "videos": 1}
+_youtube_quota: Optional[RateLimiter] = None
 
 
 def get_rate_limiter(requests_per_second: float = 2.0, burst_size: int = 5,
@@ -272,8 +450,31 @@ def get_rate_limiter(requests_per_second: float = 2.0, burst_size: int = 5,
     """
     global _rate_limiter
     if _rate_limiter is None:
-        if shared:
-            _rate_limiter = SharedRateLimiter(requests_per_second, burst_size)
-        else:
-            _rate_limiter = AdaptiveRateLimiter(requests_per_second, burst_size)
+        # Double-checked so concurrent first callers can't each build (and
+        # separately rate-limit against) their own instance.
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                if shared:
+                    _rate_limiter = SharedRateLimiter(requests_per_second, burst_size)
+                else:
+                    _rate_limiter = AdaptiveRateLimiter(requests_per_second, burst_size)
     return _rate_limiter
+
+
+def acquire_youtube_quota(call: str) -> float:
+    """Spend quota units for one YouTube Data API call, waiting if needed.
+
+    A token bucket holding a full day's quota, refilled evenly over 24h, so
+    a process can burst through what it has but not run past the daily
+    budget. ``call`` is a YOUTUBE_QUOTA_COST key ("search" or "videos").
+    """
+    global _youtube_quota
+    if _youtube_quota is None:
+        with _rate_limiter_lock:
+            if _youtube_quota is None:
+                _youtube_quota = RateLimiter(
+                    requests_per_second=YOUTUBE_DAILY_QUOTA / 86400,
+                    burst_size=YOUTUBE_DAILY_QUOTA,
+                )
+    cost = min(YOUTUBE_QUOTA_COST.get(call, 1), _youtube_quota.burst_size)
+    return _youtube_quota.acquire_n(cost)
@@ -12,21 +12,41 @@ from youtube_transcript_api._errors import (
     NoTranscriptFound,
     VideoUnavailable,
 )
-from typing import Optional
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import NamedTuple, Optional, Union
+import asyncio
+import random
 import re
 import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 from .proxy_pool import (
     classify_transport_error,
     get_pool,
 )
+from .rate_limiter import CircuitBreaker
 
 load_dotenv()
 
 # Default number of pool sessions to try on transport-class failures.
 _POOL_RETRY_LIMIT = int(os.getenv("FILMOT_PROXY_RETRY_LIMIT", "4"))
 
+# Attempts on the primary (non-pool) route for transient errors, spaced by
+# full-jitter exponential backoff.
+_PRIMARY_RETRY_LIMIT = int(os.getenv("FILMOT_PRIMARY_RETRY_LIMIT", "3"))
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 8.0
+_RETRYABLE_KINDS = frozenset({"rate_limited", "connection"})
+
+# Stops hammering the primary route once it is clearly degraded.
+_primary_breaker = CircuitBreaker(failure_threshold=5, window=60.0, reset_timeout=30.0)
+
 # Webshare gateway for the legacy username/password path.
 _WEBSHARE_GATEWAY = os.getenv("WEBSHARE_GATEWAY", "p.webshare.io:80")
 # WebshareProxyConfig appends a "-rotate" suffix to the username for the
@@ -36,6 +56,42 @@ _WEBSHARE_GATEWAY = os.getenv("WEBSHARE_GATEWAY", "p.webshare.io:80")
 # into the library's rotating behavior.
 _WEBSHARE_ROTATE = os.getenv("FILMOT_WEBSHARE_ROTATE", "0").strip().lower() in ("1", "true", "yes")
 
+# The watch / embed / v / youtu.be URL shapes unioned into one alternation
+# so a single scan covers them all.
+_VIDEO_URL_RE = re.compile(
+    r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([a-zA-Z0-9_-]{11})'
+)
+# Shortest input the URL pattern can match: "youtu.be/" plus an 11-char ID.
+_MIN_URL_LEN = len("youtu.be/") + 11
+
+
+class Segment(NamedTuple):
+    """One caption cue. Used internally; public results carry plain dicts."""
+    text: str
+    start: float
+    duration: float
+
+
+# In-process LRU of successful fetches, keyed on (video_id, languages,
+# preserve_formatting). Entries expire after FILMOT_TRANSCRIPT_CACHE_TTL
+# seconds so long-running sessions pick up corrected captions. Set
+# FILMOT_TRANSCRIPT_CACHE_SIZE=0 to disable.
+_TRANSCRIPT_CACHE_SIZE = int(os.getenv("FILMOT_TRANSCRIPT_CACHE_SIZE", "128"))
+_TRANSCRIPT_CACHE_TTL = float(os.getenv("FILMOT_TRANSCRIPT_CACHE_TTL", "3600"))
+_transcript_cache: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+_transcript_cache_lock = threading.Lock()
+
+# Segment boundary marker for search_in_transcript's joined haystack.
+_SEG_SEP = '\x00'
+
+# Connections kept alive per host in each client's requests.Session.
+_HTTP_POOL_SIZE = int(os.getenv("FILMOT_HTTP_POOL_SIZE", "20"))
+# Pool-route clients are reused per proxy URL so their sessions keep
+# connections open across fetches; bounded since the pool rotates sessions.
+_POOL_CLIENT_CACHE_SIZE = 64
+_pool_clients: "OrderedDict[str, YouTubeTranscriptApi]" = OrderedDict()
+_pool_clients_lock = threading.Lock()
+
 # Global API instance - holds the "primary" non-pool client (direct, legacy
 # Webshare via env vars, or an operator-supplied proxy from configure_proxy()).
 # The dynamic Webshare pool is layered on top by get_transcript().
@@ -45,9 +101,18 @@ _initialized = False
 _proxy_source = "direct"
 
 
+def _new_http_session() -> requests.Session:
+    """Build a requests.Session with a keep-alive pool sized for concurrent fetches."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _build_direct_api() -> YouTubeTranscriptApi:
     """Build a direct YouTubeTranscriptApi client."""
-    return YouTubeTranscriptApi()
+    return YouTubeTranscriptApi(http_client=_new_http_session())
 
 
 def _build_webshare_api(proxy_username: str, proxy_password: str) -> YouTubeTranscriptApi:
@@ -64,7 +129,8 @@ def _build_webshare_api(proxy_username: str, proxy_password: str) -> YouTubeTran
             proxy_config=WebshareProxyConfig(
                 proxy_username=proxy_username,
                 proxy_password=proxy_password,
-            )
+            ),
+            http_client=_new_http_session(),
         )
     url = f"http://{proxy_username}:{proxy_password}@{_WEBSHARE_GATEWAY}"
     return _build_generic_proxy_api(url, url)
@@ -78,10 +144,26 @@ def _build_generic_proxy_api(http_proxy: Optional[str], https_proxy: Optional[st
         proxy_config=GenericProxyConfig(
             http_url=http_proxy,
             https_url=https_proxy or http_proxy,
-        )
+        ),
+        http_client=_new_http_session(),
     )
 
 
+def _pool_client(proxy_url: str) -> YouTubeTranscriptApi:
+    """Return the cached client for a pool session's proxy URL, building it once."""
+    with _pool_clients_lock:
+        api = _pool_clients.get(proxy_url)
+        if api is not None:
+            _pool_clients.move_to_end(proxy_url)
+            return api
+    api = _build_generic_proxy_api(proxy_url, proxy_url)
+    with _pool_clients_lock:
+        api = _pool_clients.setdefault(proxy_url, api)
+        while len(_pool_clients) > _POOL_CLIENT_CACHE_SIZE:
+            _pool_clients.popitem(last=False)
+    return api
+
+
 def _primary_from_environment() -> tuple[YouTubeTranscriptApi, str, bool]:
     """Build the "primary" non-pool client from environment config.
 
@@ -178,6 +260,37 @@ def configure_proxy(
     _initialized = True
 
 
+def clear_transcript_cache() -> None:
+    """Drop every transcript held in the in-process cache."""
+    with _transcript_cache_lock:
+        _transcript_cache.clear()
+
+
+def _cache_lookup(key: tuple) -> Optional[dict]:
+    with _transcript_cache_lock:
+        entry = _transcript_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, entry = entry
+        if time.monotonic() - stored_at > _TRANSCRIPT_CACHE_TTL:
+            del _transcript_cache[key]
+            return None
+        _transcript_cache.move_to_end(key)
+    # Segments are a tuple of immutable Segment tuples, so a shallow copy
+    # is enough to keep callers from mutating the cached entry.
+    return dict(entry)
+
+
+def _cache_store(key: tuple, result: dict) -> None:
+    if _TRANSCRIPT_CACHE_SIZE <= 0:
+        return
+    with _transcript_cache_lock:
+        _transcript_cache[key] = (time.monotonic(), result)
+        _transcript_cache.move_to_end(key)
+        while len(_transcript_cache) > _TRANSCRIPT_CACHE_SIZE:
+            _transcript_cache.popitem(last=False)
+
+
 def get_api() -> YouTubeTranscriptApi:
     """Get the configured API instance."""
     _init_api()
@@ -211,6 +324,7 @@ def reset_api() -> None:
     _init_api()
 
 
+@lru_cache(maxsize=512)
 def extract_video_id(video_input: str) -> str:
     """
     Extract video ID from various YouTube URL formats or return as-is if already an ID.
@@ -221,21 +335,15 @@ def extract_video_id(video_input: str) -> str:
     - https://youtube.com/watch?v=VIDEO_ID&other_params
     - Just the VIDEO_ID itself
     """
-    # Already a video ID (11 characters, alphanumeric with - and _)
-    if re.match(r'^[a-zA-Z0-9_-]{11}$', video_input):
+    # Already a video ID (11 characters, alphanumeric with - and _), or
+    # anything else too short to hold a URL: skip the regex entirely
+    if len(video_input) < _MIN_URL_LEN:
         return video_input
     
     # YouTube URL patterns
-    patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'youtube\.com/v/([a-zA-Z0-9_-]{11})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, video_input)
-        if match:
-            return match.group(1)
+    match = _VIDEO_URL_RE.search(video_input)
+    if match:
+        return match.group(1)
     
     # If nothing matched, return as-is and let the API handle errors
     return video_input
@@ -245,6 +353,7 @@ def get_transcript(
     video_id: str,
     languages: Optional[list[str]] = None,
     preserve_formatting: bool = False,
+    include_full_text: bool = True,
 ) -> dict:
     """
     Fetch the full transcript for a YouTube video.
@@ -254,6 +363,8 @@ def get_transcript(
         languages: Preferred languages in order (e.g., ['en', 'en-US'])
                    If None, tries to get any available transcript
         preserve_formatting: If True, keeps original line breaks
+        include_full_text: If False, skip joining the segments and omit
+                   full_text (for callers that only need segments)
         
     Returns:
         dict with:
@@ -264,11 +375,33 @@ def get_transcript(
             - full_text: Complete transcript as single string
             - duration_seconds: Total video duration
     """
+    result = _get_transcript(video_id, languages, preserve_formatting, include_full_text)
+    if 'segments' in result:
+        result['segments'] = [seg._asdict() for seg in result['segments']]
+    return result
+
+
+def _get_transcript(
+    video_id: str,
+    languages: Optional[list[str]] = None,
+    preserve_formatting: bool = False,
+    include_full_text: bool = True,
+) -> dict:
+    """Route-iterating body of get_transcript(); segments stay as Segment tuples."""
     video_id = extract_video_id(video_id)
     
     if languages is None:
         languages = ['en', 'en-US', 'en-GB']
     
+    cache_key = (video_id, tuple(languages), preserve_formatting)
+    cached = _cache_lookup(cache_key)
+    if cached is not None:
+        if include_full_text and 'full_text' not in cached:
+            # Cached by a segments-only caller; join it now, no refetch.
+            cached['full_text'] = _join_segment_text(cached['segments'], preserve_formatting)
+            _cache_store(cache_key, dict(cached))
+        return cached
+    
     attempts: list[str] = []
     last_error: Optional[Exception] = None
 
@@ -280,6 +413,7 @@ def get_transcript(
                 video_id,
                 languages=languages,
                 preserve_formatting=preserve_formatting,
+                include_full_text=include_full_text,
             )
         except (TranscriptsDisabled, VideoUnavailable, NoTranscriptFound) as terminal:
             # Caption-side terminal failures — not a transport problem.
@@ -302,9 +436,17 @@ def get_transcript(
             on_outcome("success", None)
         if isinstance(result, dict) and "error" not in result:
             result["route"] = label
+            result["segments"] = tuple(result["segments"])
+            _cache_store(cache_key, result)
+            return dict(result)
         return result
 
-    error_msg = str(last_error) if last_error else "all routes exhausted"
+    if last_error:
+        error_msg = str(last_error)
+    elif _primary_breaker.state == CircuitBreaker.OPEN:
+        error_msg = f"{_proxy_source} route is failing; circuit open, try again shortly"
+    else:
+        error_msg = "all routes exhausted"
     return {
         "error": error_msg,
         "video_id": video_id,
@@ -312,6 +454,43 @@ def get_transcript(
     }
 
 
+async def get_transcript_async(
+    video_id: str,
+    languages: Optional[list[str]] = None,
+    preserve_formatting: bool = False,
+    include_full_text: bool = True,
+) -> dict:
+    """Coroutine form of get_transcript().
+
+    youtube-transcript-api only offers blocking calls, so the fetch runs on
+    the event loop's default executor; the loop itself stays free to drive
+    other fetches.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        partial(get_transcript, video_id, languages, preserve_formatting, include_full_text),
+    )
+
+
+async def get_transcripts_async(
+    video_ids: list[str],
+    languages: Optional[list[str]] = None,
+    max_concurrency: int = 8,
+) -> list[dict]:
+    """Fetch many transcripts concurrently, at most max_concurrency in flight.
+
+    Returns one result dict per input, in input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(vid: str) -> dict:
+        async with semaphore:
+            return await get_transcript_async(vid, languages)
+
+    return list(await asyncio.gather(*(_one(v) for v in video_ids)))
+
+
 def _terminal_error_result(exc: Exception, video_id: str, route: str) -> dict:
     if isinstance(exc, TranscriptsDisabled):
         msg = "Transcripts are disabled for this video"
@@ -327,7 +506,9 @@ def _iter_routes():
 
     ``on_outcome`` is a callable invoked once per attempt with either
     ``("success", None)`` or ``("failure", (kind, summary))`` so the pool can
-    update health stats. ``None`` for non-pool routes.
+    update health stats. The primary route is yielded again (after a backoff)
+    for rate-limit and connection failures, and skipped while its circuit
+    breaker is open.
     """
     mode = _resolve_proxy_mode()
     pool = None if mode == "direct-only" else get_pool()
@@ -339,7 +520,7 @@ def _iter_routes():
             if session is None:
                 break
             url = pool.proxy_url(session)
-            api = _build_generic_proxy_api(url, url)
+            api = _pool_client(url)
 
             def _cb(outcome, info, _s=session, _p=pool):
                 if outcome == "success":
@@ -352,7 +533,28 @@ def _iter_routes():
 
     # 2. Primary client (direct, env-proxy, legacy-webshare, or operator-supplied).
     if mode != "proxy-only" or pool is None:
-        yield (_proxy_source, get_api(), None)
+        last_kind = [None]
+
+        def _primary_cb(outcome, info):
+            if outcome == "success":
+                _primary_breaker.record_success()
+            else:
+                _primary_breaker.record_failure()
+                last_kind[0] = info[0]
+
+        for attempt in range(max(1, _PRIMARY_RETRY_LIMIT)):
+            if attempt:
+                if last_kind[0] not in _RETRYABLE_KINDS:
+                    break
+                time.sleep(_backoff_delay(attempt))
+            if not _primary_breaker.allow():
+                break
+            yield (_proxy_source, get_api(), _primary_cb)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given retry number (1-based)."""
+    return random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** (attempt - 1)))
 
 
 def _fetch_transcript_from_api(
@@ -360,6 +562,7 @@ def _fetch_transcript_from_api(
     video_id: str,
     languages: list[str],
     preserve_formatting: bool,
+    include_full_text: bool = True,
 ) -> dict:
     """Fetch transcript using a specific API client.
 
@@ -387,44 +590,43 @@ def _fetch_transcript_from_api(
                 # treats it as caption-side, not transport-side.
                 raise NoTranscriptFound(video_id, languages, transcript_list)
         
-        # Convert to dict format for consistency
-        segments = [
-            {
-                'text': seg.text,
-                'start': seg.start,
-                'duration': getattr(seg, 'duration', 0),
-            }
-            for seg in transcript
-        ]
-        
-        # Build full text
-        if preserve_formatting:
-            full_text = '\n'.join(seg['text'] for seg in segments)
-        else:
-            full_text = ' '.join(seg['text'].replace('\n', ' ') for seg in segments)
-        
-        # Calculate total duration
-        if segments:
-            last_seg = segments[-1]
-            duration_seconds = last_seg['start'] + last_seg.get('duration', 0)
-        else:
-            duration_seconds = 0
-        
-        return {
+        # Collect segments and the trailing end time in a single pass.
+        segments = []
+        last_start = last_dur = 0
+        for seg in transcript:
+            last_start = seg.start
+            last_dur = seg.duration
+            segments.append(Segment(seg.text, last_start, last_dur))
+
+        result = {
             'video_id': transcript.video_id,
             'language': transcript.language_code,
             'is_generated': transcript.is_generated,
             'segments': segments,
-            'full_text': full_text,
-            'duration_seconds': duration_seconds,
+            'duration_seconds': last_start + last_dur,
             'segment_count': len(segments),
         }
+        if include_full_text:
+            result['full_text'] = _join_segment_text(segments, preserve_formatting)
+        return result
         
     except (TranscriptsDisabled, VideoUnavailable, NoTranscriptFound):
         # Re-raise terminal errors so the route iterator can short-circuit.
         raise
 
 
+def _join_segment_text(segments, preserve_formatting: bool) -> str:
+    """Build full_text from Segment tuples.
+
+    Without preserve_formatting, embedded newlines are flattened by one
+    replace over the joined string rather than one per segment.
+    """
+    texts = [seg.text for seg in segments]
+    if preserve_formatting:
+        return '\n'.join(texts)
+    return ' '.join(texts).replace('\n', ' ')
+
+
 def get_transcript_with_timestamps(
     video_id: str,
     languages: Optional[list[str]] = None,
@@ -444,7 +646,7 @@ def get_transcript_with_timestamps(
     Returns:
         dict with chunked transcript for easier navigation
     """
-    result = get_transcript(video_id, languages, preserve_formatting=False)
+    result = _get_transcript(video_id, languages, preserve_formatting=False)
     
     if 'error' in result:
         return result
@@ -452,37 +654,25 @@ def get_transcript_with_timestamps(
     segments = result['segments']
     chunk_seconds = chunk_minutes * 60
     
+    # Cues are sorted by start time, so each chunk ends where a bisect for
+    # the next chunk boundary lands: Python-level work is per chunk, not
+    # per cue.
+    starts = [seg.start for seg in segments]
+    texts = [seg.text for seg in segments]
     chunks = []
-    current_chunk = {
-        'start': 0,
-        'start_formatted': '0:00',
-        'texts': [],
-    }
-    
-    for seg in segments:
-        chunk_index = int(seg['start'] // chunk_seconds)
-        expected_start = chunk_index * chunk_seconds
-        
-        if expected_start != current_chunk['start'] and current_chunk['texts']:
-            # Save current chunk and start new one
-            current_chunk['text'] = ' '.join(current_chunk['texts'])
-            del current_chunk['texts']
-            chunks.append(current_chunk)
-            
-            current_chunk = {
-                'start': expected_start,
-                'start_formatted': format_timestamp(expected_start),
-                'texts': [],
-            }
-        
-        current_chunk['texts'].append(seg['text'].replace('\n', ' '))
-    
-    # Don't forget the last chunk
-    if current_chunk['texts']:
-        current_chunk['text'] = ' '.join(current_chunk['texts'])
-        del current_chunk['texts']
-        chunks.append(current_chunk)
-    
+    a, n = 0, len(segments)
+    while a < n:
+        idx = int(starts[a] // chunk_seconds)
+        b = max(bisect_left(starts, (idx + 1) * chunk_seconds, a), a + 1)
+        chunk_start = idx * chunk_seconds
+        chunks.append({
+            'start': chunk_start,
+            'start_formatted': format_timestamp(chunk_start),
+            'text': ' '.join(texts[a:b]).replace('\n', ' '),
+        })
+        a = b
+    
+    result['segments'] = [seg._asdict() for seg in segments]
     result['chunks'] = chunks
     result['chunk_minutes'] = chunk_minutes
     
@@ -503,51 +693,98 @@ def format_timestamp(seconds: float) -> str:
 
 def search_in_transcript(
     video_id: str,
-    query: str,
+    query: Union[str, list[str]],
     context_segments: int = 2,
     languages: Optional[list[str]] = None,
+    time_range: Optional[tuple[float, float]] = None,
 ) -> dict:
     """
     Search for specific terms within a video's transcript.
     
-    Returns matching segments with surrounding context.
+    Returns matching segments with surrounding context. Each segment is
+    reported once, with the first term found in it.
     
     Args:
         video_id: YouTube video ID or URL
-        query: Search term (case-insensitive)
+        query: Search term, or a list of terms matched in a single pass
+               (case-insensitive)
         context_segments: Number of segments before/after to include
         languages: Preferred languages
+        time_range: Optional (start, end) in seconds; only segments starting
+                    inside it are searched (context may reach outside it)
         
     Returns:
         dict with matching segments and their context
     """
-    result = get_transcript(video_id, languages)
+    result = _get_transcript(video_id, languages, include_full_text=False)
     
     if 'error' in result:
         return result
     
     segments = result['segments']
-    query_lower = query.lower()
     matches = []
     
-    for i, seg in enumerate(segments):
-        if query_lower in seg['text'].lower():
-            # Get context
-            start_idx = max(0, i - context_segments)
-            end_idx = min(len(segments), i + context_segments + 1)
-            
-            context_text = ' '.join(
-                s['text'].replace('\n', ' ') 
-                for s in segments[start_idx:end_idx]
-            )
-            
-            matches.append({
-                'timestamp': format_timestamp(seg['start']),
-                'start_seconds': seg['start'],
-                'matched_text': seg['text'],
-                'context': context_text,
-                'segment_index': i,
-            })
+    # Segments to search, [lo, hi). Cues arrive sorted by start time, so a
+    # time range is two binary searches rather than a scan.
+    lo, hi = 0, len(segments)
+    if time_range is not None:
+        starts = [seg.start for seg in segments]
+        lo = bisect_left(starts, time_range[0])
+        hi = bisect_right(starts, time_range[1])
+    
+    # Join the window's raw texts on NUL (which XML captions can't carry),
+    # then flatten newlines and lowercase in one pass each. Every NUL in
+    # the haystack is a segment boundary and no match can straddle two.
+    # Context is cleaned per match from the raw texts, window plus margin.
+    base = max(0, lo - context_segments)
+    texts = [seg.text for seg in segments[base:hi + context_segments]]
+    haystack = _SEG_SEP.join(texts[lo - base:hi - base]).replace('\n', ' ').lower()
+    terms = [query] if isinstance(query, str) else list(query)
+    needles = [t.replace('\n', ' ').replace(_SEG_SEP, '').lower() for t in terms]
+    
+    if len(needles) == 1:
+        needle, term = needles[0], terms[0]
+        
+        def _next_hit(start: int) -> tuple:
+            return haystack.find(needle, start), term
+    else:
+        # Several terms: one alternation of escaped literals scans the
+        # haystack once. Longest first, so overlapping terms report the
+        # most specific one.
+        term_of: dict = {}
+        for n, t in zip(needles, terms):
+            term_of.setdefault(n, t)
+        pattern = re.compile('|'.join(re.escape(n) for n in sorted(term_of, key=len, reverse=True)))
+        
+        def _next_hit(start: int) -> tuple:
+            m = pattern.search(haystack, start)
+            return (m.start(), term_of[m.group()]) if m else (-1, None)
+    
+    i = lo
+    scanned = 0
+    pos, hit_term = _next_hit(0) if lo < hi and needles else (-1, None)
+    while pos != -1:
+        i += haystack.count(_SEG_SEP, scanned, pos)
+        seg = segments[i]
+        start_idx = max(0, i - context_segments) - base
+        context_text = ' '.join(texts[start_idx:i + context_segments + 1 - base]).replace('\n', ' ')
+        
+        matches.append({
+            'timestamp': format_timestamp(seg.start),
+            'start_seconds': seg.start,
+            'matched_text': seg.text,
+            'context': context_text,
+            'segment_index': i,
+            'term': hit_term,
+        })
+        
+        # One hit per segment: resume the scan at the next segment.
+        end = haystack.find(_SEG_SEP, pos)
+        if end == -1:
+            break
+        i += 1
+        scanned = end + 1
+        pos, hit_term = _next_hit(scanned)
     
     return {
         'video_id': result['video_id'],
@@ -1,10 +1,19 @@
 """Watchlist and saved results management for Filmot CLI."""
 
+import hashlib
 import json
+import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class Watchlist:
     """Manage saved videos and search results."""
@@ -21,25 +30,164 @@ class Watchlist:
         
         self.watchlist_file = self.storage_dir / "watchlist.json"
         self.saved_searches_file = self.storage_dir / "saved_searches.json"
+        # Cached search results live one file per search, so listing saved
+        # searches never parses them.
+        self.saved_results_dir = self.storage_dir / "saved_results"
+        
+        # Each file is loaded on first access (see the properties below), so
+        # commands that only touch one of them never parse the other.
+        self._watchlist_data: Optional[Dict[str, Any]] = None
+        self._saved_searches_data: Optional[Dict[str, Any]] = None
+        self._index_data: Dict[str, Dict[str, Any]] = {}
+        self._tag_index_data: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._search_index_data: Dict[str, Dict[str, Any]] = {}
         
-        self._watchlist = self._load_file(self.watchlist_file)
-        self._saved_searches = self._load_file(self.saved_searches_file)
+        # Inside batch(), writes are deferred and only these flags are set.
+        self._batch_depth = 0
+        self._dirty_watchlist = False
+        self._dirty_saved = False
+        # One timestamp for every entry stamped inside the same batch.
+        self._batch_now: Optional[str] = None
+    
+    def _ensure_watchlist(self) -> None:
+        """Load watchlist.json and index it by video ID, once."""
+        if self._watchlist_data is None:
+            self._watchlist_data = self._load_file(self.watchlist_file)
+            # Index entries are the same dicts as the list's, so in-place
+            # edits show up in both.
+            self._index_data = self._build_index(self._watchlist_data["items"], "video_id")
+            # tag -> {video_id: item}, so tag filters don't scan every item.
+            self._tag_index_data = {}
+            for item in self._index_data.values():
+                for tag in item.get("tags", []):
+                    self._tag_index_data.setdefault(tag, {})[item["video_id"]] = item
+    
+    def _ensure_saved_searches(self) -> None:
+        """Load saved_searches.json and index it by name, once."""
+        if self._saved_searches_data is None:
+            self._saved_searches_data = self._load_file(self.saved_searches_file)
+            self._search_index_data = self._build_index(self._saved_searches_data["items"], "name")
+    
+    @property
+    def _watchlist(self) -> Dict[str, Any]:
+        self._ensure_watchlist()
+        return self._watchlist_data
+    
+    @property
+    def _index(self) -> Dict[str, Dict[str, Any]]:
+        self._ensure_watchlist()
+        return self._index_data
+    
+    @property
+    def _tag_index(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        self._ensure_watchlist()
+        return self._tag_index_data
+    
+    @property
+    def _saved_searches(self) -> Dict[str, Any]:
+        self._ensure_saved_searches()
+        return self._saved_searches_data
+    
+    @property
+    def _search_index(self) -> Dict[str, Dict[str, Any]]:
+        self._ensure_saved_searches()
+        return self._search_index_data
+    
+    @staticmethod
+    def _build_index(items: List[Dict[str, Any]], key: str) -> Dict[str, Dict[str, Any]]:
+        """Map key -> first item carrying it."""
+        index: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            index.setdefault(item.get(key), item)
+        return index
+    
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Any]:
+        """Parse a JSON file, or None if it is missing or unreadable."""
+        if not path.exists():
+            return None
+        try:
+            if HAS_ORJSON:
+                return orjson.loads(path.read_bytes())
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+    
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """Write data as indented JSON."""
+        if HAS_ORJSON:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     
     def _load_file(self, path: Path) -> Dict[str, Any]:
         """Load JSON file or return empty dict."""
-        if path.exists():
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {"items": [], "created": datetime.now().isoformat()}
-        return {"items": [], "created": datetime.now().isoformat()}
+        data = self._read_json(path)
+        if data is None:
+            return {"items": [], "created": datetime.now().isoformat()}
+        return data
     
     def _save_file(self, path: Path, data: Dict[str, Any]) -> None:
         """Save data to JSON file."""
         data["updated"] = datetime.now().isoformat()
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self._write_json(path, data)
+    
+    def _results_path(self, name: str) -> Path:
+        """Side file holding a saved search's cached results."""
+        slug = re.sub(r'[^\w-]+', '_', name)[:40]
+        digest = hashlib.sha1(name.encode('utf-8')).hexdigest()[:10]
+        return self.saved_results_dir / f"{slug}-{digest}.json"
+    
+    def _now(self) -> str:
+        """Current time as ISO text; fixed for the duration of a batch."""
+        if self._batch_now is not None:
+            return self._batch_now
+        return datetime.now().isoformat()
+    
+    def _persist_watchlist(self) -> None:
+        if self._batch_depth:
+            self._dirty_watchlist = True
+        else:
+            self._save_file(self.watchlist_file, self._watchlist)
+    
+    def _persist_saved_searches(self) -> None:
+        if self._batch_depth:
+            self._dirty_saved = True
+        else:
+            self._save_file(self.saved_searches_file, self._saved_searches)
+    
+    def flush(self) -> None:
+        """Write any files modified inside a batch() block."""
+        if self._dirty_watchlist:
+            self._save_file(self.watchlist_file, self._watchlist)
+            self._dirty_watchlist = False
+        if self._dirty_saved:
+            self._save_file(self.saved_searches_file, self._saved_searches)
+            self._dirty_saved = False
+    
+    @contextmanager
+    def batch(self) -> Iterator["Watchlist"]:
+        """
+        Group several mutations into one write per file.
+        
+        Usage:
+            with watchlist.batch():
+                for video in results:
+                    watchlist.add_video(video)
+        """
+        if not self._batch_depth:
+            self._batch_now = datetime.now().isoformat()
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._batch_now = None
+                self.flush()
     
     # ========== WATCHLIST OPERATIONS ==========
     
@@ -57,9 +205,8 @@ class Watchlist:
         video_id = video.get("id", "")
         
         # Check if already in watchlist
-        for item in self._watchlist["items"]:
-            if item.get("video_id") == video_id:
-                return False
+        if video_id in self._index:
+            return False
         
         entry = {
             "video_id": video_id,
@@ -69,48 +216,56 @@ class Watchlist:
             "views": video.get("viewcount", 0),
             "duration": video.get("duration", 0),
             "upload_date": video.get("uploaddate", ""),
-            "added_at": datetime.now().isoformat(),
+            "added_at": self._now(),
             "notes": notes,
             "tags": [],
             "watched": False
         }
         
         self._watchlist["items"].append(entry)
-        self._save_file(self.watchlist_file, self._watchlist)
+        self._index[video_id] = entry
+        self._persist_watchlist()
         return True
     
     def remove_video(self, video_id: str) -> bool:
         """Remove a video from the watchlist."""
-        original_len = len(self._watchlist["items"])
+        item = self._index.pop(video_id, None)
+        if item is None:
+            return False
+        for tag in item.get("tags", []):
+            tagged = self._tag_index.get(tag)
+            if tagged is not None:
+                tagged.pop(video_id, None)
+                if not tagged:
+                    del self._tag_index[tag]
+        # The index holds only the first entry per ID; older files may
+        # carry duplicates, and every copy goes.
         self._watchlist["items"] = [
-            item for item in self._watchlist["items"]
-            if item.get("video_id") != video_id
+            i for i in self._watchlist["items"] if i.get("video_id") != video_id
         ]
-        
-        if len(self._watchlist["items"]) < original_len:
-            self._save_file(self.watchlist_file, self._watchlist)
-            return True
-        return False
+        self._persist_watchlist()
+        return True
     
     def mark_watched(self, video_id: str, watched: bool = True) -> bool:
         """Mark a video as watched/unwatched."""
-        for item in self._watchlist["items"]:
-            if item.get("video_id") == video_id:
-                item["watched"] = watched
-                item["watched_at"] = datetime.now().isoformat() if watched else None
-                self._save_file(self.watchlist_file, self._watchlist)
-                return True
-        return False
+        item = self._index.get(video_id)
+        if item is None:
+            return False
+        item["watched"] = watched
+        item["watched_at"] = self._now() if watched else None
+        self._persist_watchlist()
+        return True
     
     def add_tag(self, video_id: str, tag: str) -> bool:
         """Add a tag to a watchlist video."""
-        for item in self._watchlist["items"]:
-            if item.get("video_id") == video_id:
-                if tag not in item.get("tags", []):
-                    item.setdefault("tags", []).append(tag)
-                    self._save_file(self.watchlist_file, self._watchlist)
-                return True
-        return False
+        item = self._index.get(video_id)
+        if item is None:
+            return False
+        if tag not in item.get("tags", []):
+            item.setdefault("tags", []).append(tag)
+            self._tag_index.setdefault(tag, {})[video_id] = item
+            self._persist_watchlist()
+        return True
     
     def get_watchlist(self, tag: Optional[str] = None, 
                       watched: Optional[bool] = None) -> List[Dict[str, Any]]:
@@ -124,10 +279,16 @@ class Watchlist:
         Returns:
             List of matching watchlist items
         """
-        items = self._watchlist["items"]
-        
         if tag is not None:
-            items = [i for i in items if tag in i.get("tags", [])]
+            # Filter the list rather than the tag bucket so results keep
+            # watchlist order, not the order the tag was applied in.
+            tagged = self._tag_index.get(tag, {})
+            items = [
+                i for i in self._watchlist["items"]
+                if tagged.get(i.get("video_id")) is i
+            ]
+        else:
+            items = self._watchlist["items"]
         
         if watched is not None:
             items = [i for i in items if i.get("watched", False) == watched]
@@ -138,7 +299,9 @@ class Watchlist:
         """Clear all watchlist items. Returns count of items removed."""
         count = len(self._watchlist["items"])
         self._watchlist["items"] = []
-        self._save_file(self.watchlist_file, self._watchlist)
+        self._index.clear()
+        self._tag_index.clear()
+        self._persist_watchlist()
         return count
     
     # ========== SAVED SEARCHES ==========
@@ -161,31 +324,39 @@ class Watchlist:
             "name": name,
             "query": query,
             "params": params,
-            "saved_at": datetime.now().isoformat(),
+            "saved_at": self._now(),
             "result_count": len(results.get("result", [])) if results else 0,
-            "results": results
         }
         
-        # Update existing or add new
-        found = False
-        for i, item in enumerate(self._saved_searches["items"]):
-            if item.get("name") == name:
-                self._saved_searches["items"][i] = entry
-                found = True
-                break
+        results_path = self._results_path(name)
+        if results is not None:
+            self.saved_results_dir.mkdir(exist_ok=True)
+            self._write_json(results_path, results)
+        else:
+            results_path.unlink(missing_ok=True)
         
-        if not found:
+        # Update existing in place (keeps its list position) or add new
+        existing = self._search_index.get(name)
+        if existing is not None:
+            existing.clear()
+            existing.update(entry)
+        else:
             self._saved_searches["items"].append(entry)
+            self._search_index[name] = entry
         
-        self._save_file(self.saved_searches_file, self._saved_searches)
+        self._persist_saved_searches()
         return True
     
     def get_saved_search(self, name: str) -> Optional[Dict[str, Any]]:
-        """Get a saved search by name."""
-        for item in self._saved_searches["items"]:
-            if item.get("name") == name:
-                return item
-        return None
+        """Get a saved search by name, with its cached results loaded."""
+        item = self._search_index.get(name)
+        if item is None:
+            return None
+        entry = dict(item)
+        if "results" not in entry:
+            # Older files kept results inline; newer ones use a side file.
+            entry["results"] = self._read_json(self._results_path(name))
+        return entry
     
     def list_saved_searches(self) -> List[Dict[str, Any]]:
         """List all saved searches (without full results)."""
@@ -202,26 +373,22 @@ class Watchlist:
     
     def delete_saved_search(self, name: str) -> bool:
         """Delete a saved search."""
-        original_len = len(self._saved_searches["items"])
+        item = self._search_index.pop(name, None)
+        if item is None:
+            return False
+        self._results_path(name).unlink(missing_ok=True)
         self._saved_searches["items"] = [
-            item for item in self._saved_searches["items"]
-            if item.get("name") != name
+            i for i in self._saved_searches["items"] if i.get("name") != name
         ]
-        
-        if len(self._saved_searches["items"]) < original_len:
-            self._save_file(self.saved_searches_file, self._saved_searches)
-            return True
-        return False
+        self._persist_saved_searches()
+        return True
     
     def stats(self) -> Dict[str, Any]:
         """Get watchlist statistics."""
         items = self._watchlist["items"]
         watched_count = sum(1 for i in items if i.get("watched", False))
         
-        all_tags = []
-        for item in items:
-            all_tags.extend(item.get("tags", []))
-        unique_tags = list(set(all_tags))
+        unique_tags = list(self._tag_index)
         
         return {
             "total_videos": len(items),
@@ -1,13 +1,36 @@
-"""YouTube Data API integration for searching recent videos."""
+"""YouTube Data API integration for searching recent videos.
+
+Requests go straight to the REST endpoints through youtube_search's shared
+session, cache and quota bucket; no discovery client is built.
+"""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 
+from .youtube_search import (
+    YOUTUBE_SEARCH_URL,
+    YOUTUBE_VIDEOS_URL,
+    _api_get,
+    _apply_search_filters,
+    _to_iso8601,
+)
+
 load_dotenv()
 
+# videos.list fields read by _video_details().
+_VIDEO_DETAIL_FIELDS = (
+    'etag,items(id,'
+    'snippet(title,channelTitle,channelId,description,publishedAt,categoryId,tags),'
+    'statistics(viewCount,likeCount,commentCount),'
+    'contentDetails(duration,definition,caption,licensedContent))'
+)
 
+
+@lru_cache(maxsize=1)
 def get_youtube_api_key() -> str:
     """Get YouTube API key from environment."""
     key = os.getenv("YOUTUBE_API_KEY", "")
@@ -72,20 +95,31 @@ def search_youtube_videos(
     Returns:
         List of video dicts with title, channel, views, url, etc.
     """
-    try:
-        from googleapiclient.discovery import build
-    except ImportError:
-        raise ImportError(
-            "google-api-python-client not installed. Run: pip install google-api-python-client"
-        )
-    
-    api_key = get_youtube_api_key()
-    youtube = build('youtube', 'v3', developerKey=api_key)
+    filters = dict(locals())
     
     # Build search parameters
+    search_params = _base_search_params(query, days, max_results, order, published_after)
+    _apply_search_filters(search_params, filters)
+    
+    video_ids = _search_video_ids(search_params)
+    if not video_ids:
+        return []
+    return _video_details(video_ids)
+
+
+def _base_search_params(
+    query: str,
+    days: Optional[int],
+    max_results: int,
+    order: str = "date",
+    published_after: Optional[str] = None,
+) -> dict:
+    """search.list parameters common to every search."""
     search_params = {
         'q': query,
-        'part': 'id,snippet',
+        # Only the IDs are read; details come from videos.list.
+        'part': 'id',
+        'fields': 'etag,items/id/videoId',
         'type': 'video',
         'maxResults': min(max_results, 50),
         'order': order,
@@ -95,102 +129,62 @@ def search_youtube_videos(
     if published_after:
         search_params['publishedAfter'] = published_after
     elif days:
-        after_date = (datetime.utcnow() - timedelta(days=days)).isoformat() + 'Z'
-        search_params['publishedAfter'] = after_date
-    
-    if published_before:
-        search_params['publishedBefore'] = published_before
-    
-    # Channel filter
-    if channel_id:
-        search_params['channelId'] = channel_id
-    
-    # Region/language
-    if region_code:
-        search_params['regionCode'] = region_code
-    if relevance_language:
-        search_params['relevanceLanguage'] = relevance_language
-    
-    # Safe search
-    if safe_search:
-        search_params['safeSearch'] = safe_search
-    
-    # Video filters
-    if video_caption:
-        search_params['videoCaption'] = video_caption
-    if video_category_id:
-        search_params['videoCategoryId'] = video_category_id
-    if video_definition:
-        search_params['videoDefinition'] = video_definition
-    if video_dimension:
-        search_params['videoDimension'] = video_dimension
-    if video_duration:
-        search_params['videoDuration'] = video_duration
-    if video_embeddable:
-        search_params['videoEmbeddable'] = video_embeddable
-    if video_license:
-        search_params['videoLicense'] = video_license
-    if video_syndicated:
-        search_params['videoSyndicated'] = video_syndicated
-    if video_type:
-        search_params['videoType'] = video_type
-    
-    # Live events
-    if event_type:
-        search_params['eventType'] = event_type
-    
-    # Location-based search
-    if location:
-        search_params['location'] = location
-        if location_radius:
-            search_params['locationRadius'] = location_radius
-        else:
-            search_params['locationRadius'] = '50km'  # default radius
-    
-    # Topic
-    if topic_id:
-        search_params['topicId'] = topic_id
-    
-    # Execute search
-    search_response = youtube.search().list(**search_params).execute()
-    
-    video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+        search_params['publishedAfter'] = _to_iso8601(datetime.utcnow() - timedelta(days=days))
     
-    if not video_ids:
-        return []
+    return search_params
+
+
+def _search_video_ids(search_params: dict) -> list[str]:
+    """Run search.list and return the matching video IDs."""
+    params = dict(search_params, key=get_youtube_api_key())
+    search_response = _api_get(YOUTUBE_SEARCH_URL, "search", params)
+    return [item['id']['videoId'] for item in search_response.get('items', [])]
+
+
+def _video_details(video_ids: list[str]) -> list[dict]:
+    """
+    Fetch snippet, statistics and content details for the given IDs.
     
+    Rows come back in video_ids order; IDs the API doesn't return (deleted
+    or private videos) are left out.
+    """
     # Get video statistics
-    videos_response = youtube.videos().list(
-        part='snippet,statistics,contentDetails',
-        id=','.join(video_ids)
-    ).execute()
-    
-    results = []
-    for video in videos_response.get('items', []):
-        snippet = video['snippet']
-        stats = video.get('statistics', {})
-        content = video.get('contentDetails', {})
-        
-        results.append({
-            'video_id': video['id'],
-            'title': snippet['title'],
-            'channel_title': snippet['channelTitle'],
-            'channel_id': snippet['channelId'],
-            'description': snippet.get('description', '')[:500],
-            'published_at': snippet['publishedAt'],
-            'views': int(stats.get('viewCount', 0)),
-            'likes': int(stats.get('likeCount', 0)),
-            'comments': int(stats.get('commentCount', 0)),
-            'duration': content.get('duration', 'PT0S'),
-            'definition': content.get('definition', 'sd'),
-            'caption': content.get('caption', 'false'),
-            'licensed_content': content.get('licensedContent', False),
-            'category_id': snippet.get('categoryId', ''),
-            'tags': snippet.get('tags', []),
-            'url': f"https://youtube.com/watch?v={video['id']}",
-        })
-    
-    return results
+    videos_response = _api_get(YOUTUBE_VIDEOS_URL, "videos", {
+        'key': get_youtube_api_key(),
+        'part': 'snippet,statistics,contentDetails',
+        'id': ','.join(video_ids),
+        'fields': _VIDEO_DETAIL_FIELDS,
+    })
+    rows = {video['id']: _video_row(video) for video in videos_response.get('items', ())}
+    return [rows[vid] for vid in video_ids if vid in rows]
+
+
+def _video_row(video: dict) -> dict:
+    """One videos.list item as a result dict."""
+    snippet = video['snippet']
+    get = snippet.get
+    stats = video.get('statistics', {}).get
+    content = video.get('contentDetails', {}).get
+    video_id = video['id']
+    
+    return {
+        'video_id': video_id,
+        'title': snippet['title'],
+        'channel_title': snippet['channelTitle'],
+        'channel_id': snippet['channelId'],
+        'description': get('description', '')[:500],
+        'published_at': snippet['publishedAt'],
+        'views': int(stats('viewCount', 0)),
+        'likes': int(stats('likeCount', 0)),
+        'comments': int(stats('commentCount', 0)),
+        'duration': content('duration', 'PT0S'),
+        'definition': content('definition', 'sd'),
+        'caption': content('caption', 'false'),
+        'licensed_content': content('licensedContent', False),
+        'category_id': get('categoryId', ''),
+        'tags': get('tags', []),
+        'url': "https://youtube.com/watch?v=" + video_id,
+    }
 
 
 def search_with_transcript(
@@ -198,35 +192,48 @@ def search_with_transcript(
     transcript_query: Optional[str] = None,
     days: int = 7,
     max_results: int = 10,
+    max_workers: int = 8,
 ) -> list[dict]:
     """
     Search YouTube and fetch transcripts for matching videos.
     
+    Transcripts are fetched concurrently (they are independent, I/O-bound
+    round-trips); results keep the search order.
+    
     Args:
         query: Search query for YouTube
         transcript_query: Optional different query for transcript search
         days: How many days back to search
         max_results: Max videos to process
+        max_workers: Max transcript fetches in flight at once
     
     Returns:
         List of videos with transcript matches
     """
     from .transcript import search_in_transcript
     
-    videos = search_youtube_videos(query, days=days, max_results=max_results)
+    video_ids = _search_video_ids(_base_search_params(query, days, max_results))
+    if not video_ids:
+        return []
     
     search_term = transcript_query or query
-    results_with_transcripts = []
     
-    for video in videos:
+    def _matches(video_id: str) -> tuple:
         try:
-            transcript_result = search_in_transcript(video['video_id'], search_term)
-            video['transcript_matches'] = transcript_result.get('matches', [])
-            video['transcript_match_count'] = transcript_result.get('match_count', 0)
+            transcript_result = search_in_transcript(video_id, search_term)
+            return transcript_result.get('matches', []), transcript_result.get('match_count', 0)
         except Exception:
-            video['transcript_matches'] = []
-            video['transcript_match_count'] = 0
-        
-        results_with_transcripts.append(video)
-    
-    return results_with_transcripts
+            return [], 0
+    
+    # Transcript fetches and the details lookup only need the IDs, so the
+    # details call runs on this thread while the transcripts download.
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(video_ids)))) as pool:
+        pending = {vid: pool.submit(_matches, vid) for vid in video_ids}
+        videos = _video_details(video_ids)
+        for video in videos:
+            future = pending.get(video['video_id'])
+            matches, count = future.result() if future else ([], 0)
+            video['transcript_matches'] = matches
+            video['transcript_match_count'] = count
+    
+    return videos
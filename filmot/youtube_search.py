@@ -7,10 +7,25 @@ transcript.py for fetching captions.
 """
 
 import os
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Optional, List, Dict, Any
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import Cache
+from .rate_limiter import acquire_youtube_quota
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 load_dotenv()
 
@@ -18,6 +33,177 @@ YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
 YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
 YOUTUBE_VIDEOS_URL = "https://www.googleapis.com/youtube/v3/videos"
 
+# search/videos responses are cached on disk so repeated queries skip the
+# round-trip and don't spend quota. Entries younger than the TTL are used
+# as-is; older ones are kept for a week and revalidated with their ETag.
+# A TTL of 0 disables the cache.
+YOUTUBE_CACHE_DIR = os.path.join(".filmot_cache", "youtube")
+YOUTUBE_CACHE_TTL = int(os.getenv("FILMOT_YOUTUBE_CACHE_TTL", "3600"))
+YOUTUBE_CACHE_RETENTION = 7 * 24 * 3600
+
+_WATCH_URL = "https://youtube.com/watch?v="
+
+# search.list filters that map one-to-one from a keyword argument,
+# as (argument name, API parameter).
+_SEARCH_FILTERS = (
+    ("channel_id", "channelId"),
+    ("region_code", "regionCode"),
+    ("relevance_language", "relevanceLanguage"),
+    ("safe_search", "safeSearch"),
+    ("video_caption", "videoCaption"),
+    ("video_category_id", "videoCategoryId"),
+    ("video_definition", "videoDefinition"),
+    ("video_dimension", "videoDimension"),
+    ("video_duration", "videoDuration"),
+    ("video_embeddable", "videoEmbeddable"),
+    ("video_license", "videoLicense"),
+    ("video_syndicated", "videoSyndicated"),
+    ("video_type", "videoType"),
+    ("event_type", "eventType"),
+    ("topic_id", "topicId"),
+)
+
+# Both endpoints return at most 50 items per request.
+_PAGE_SIZE = 50
+# Concurrent videos.list batches when more than 50 IDs are requested.
+_DETAIL_WORKERS = 4
+
+# `fields` masks trimming responses to what the parsers below read.
+_SNIPPET_FIELDS = "snippet(title,description,channelTitle,channelId,publishedAt,thumbnails/high/url)"
+SEARCH_FIELDS = f"etag,nextPageToken,items(id/videoId,{_SNIPPET_FIELDS})"
+VIDEOS_FIELDS = (
+    f"etag,items(id,{_SNIPPET_FIELDS},"
+    "statistics(viewCount,likeCount,commentCount),contentDetails/duration)"
+)
+
+# One keep-alive session for every call, so search_recent's search and
+# details requests share a TLS connection instead of handshaking twice.
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+_metadata_cache: Optional[Cache] = None
+
+
+def get_metadata_cache() -> Optional[Cache]:
+    """Return the on-disk cache for YouTube API responses, or None if disabled."""
+    global _metadata_cache
+    if YOUTUBE_CACHE_TTL <= 0:
+        return None
+    if _metadata_cache is None:
+        _metadata_cache = Cache(
+            cache_dir=YOUTUBE_CACHE_DIR,
+            ttl=max(YOUTUBE_CACHE_TTL, YOUTUBE_CACHE_RETENTION),
+        )
+    return _metadata_cache
+
+
+def _to_iso8601(dt: datetime) -> str:
+    """Format a naive UTC datetime as an RFC 3339 timestamp, e.g. 2024-01-31T09:05:00Z."""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+    )
+
+
+def _apply_search_filters(params: Dict[str, Any], values: Dict[str, Any]) -> None:
+    """
+    Copy the optional search.list filters set in values into params.
+    
+    Shared by search_videos and youtube.search_youtube_videos.
+    
+    Args:
+        params: Request parameters, updated in place
+        values: Keyword arguments of the calling search function
+    """
+    for arg, api_name in _SEARCH_FILTERS:
+        value = values.get(arg)
+        if value:
+            params[api_name] = value
+    
+    published_before = values.get("published_before")
+    if published_before:
+        if isinstance(published_before, datetime):
+            published_before = _to_iso8601(published_before)
+        params["publishedBefore"] = published_before
+    
+    # Location-based search
+    location = values.get("location")
+    if location:
+        params["location"] = location
+        params["locationRadius"] = values.get("location_radius") or "50km"
+
+
+def _cache_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Request params minus the API key, used as the cache key."""
+    return {k: v for k, v in params.items() if k != "key"}
+
+
+def _api_get(url: str, endpoint: str, params: Dict[str, Any],
+             cache_key: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    GET a Data API endpoint through the metadata cache.
+    
+    Fresh entries are returned without a request. Stale ones are sent with
+    If-None-Match, and a 304 reuses the stored body.
+    
+    Args:
+        url: Endpoint URL
+        endpoint: Cache namespace ("search" or "videos")
+        params: Query parameters (including the API key)
+        cache_key: Params to key the cache on (default: params minus key)
+        
+    Returns:
+        Parsed JSON response
+    """
+    cache = get_metadata_cache()
+    if cache_key is None:
+        cache_key = _cache_params(params)
+    entry = cache.get_entry(endpoint, cache_key) if cache is not None else None
+    
+    headers = {}
+    if entry is not None:
+        stored = entry.get("data") or {}
+        if time.time() - entry.get("timestamp", 0) < YOUTUBE_CACHE_TTL:
+            return stored.get("body", {})
+        if stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+    
+    acquire_youtube_quota(endpoint)
+    response = _http().get(url, params=params, headers=headers)
+    if response.status_code == 304 and entry is not None:
+        cache.set(endpoint, cache_key, entry["data"])  # restart the TTL
+        return entry["data"].get("body", {})
+    response.raise_for_status()
+    data = orjson.loads(response.content) if HAS_ORJSON else response.json()
+    
+    if cache is not None:
+        etag = response.headers.get("ETag") or data.get("etag")
+        cache.set(endpoint, cache_key, {"etag": etag, "body": data})
+    return data
+
+
+def _http() -> requests.Session:
+    """Return the shared requests.Session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Transient 429/5xx are retried with a short backoff; the
+                # last response is still returned for raise_for_status().
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    raise_on_status=False,
+                )
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=4, pool_maxsize=16, max_retries=retry,
+                ))
+                _session = session
+    return _session
+
 
 def validate_youtube_api():
     """Check if YouTube API key is configured."""
@@ -58,7 +244,8 @@ def search_videos(
     
     Args:
         query: Search terms (supports YouTube search operators)
-        max_results: Maximum number of results (1-50)
+        max_results: Maximum number of results; above 50, further pages
+            are fetched (each page costs another 100 quota units)
         published_after: Only videos published after this date
         published_before: Only videos published before this date
         order: Sort order - date, rating, relevance, title, viewCount
@@ -83,95 +270,45 @@ def search_videos(
     Returns:
         List of video metadata dictionaries
     """
+    filters = dict(locals())
     validate_youtube_api()
     
     params = {
         "key": YOUTUBE_API_KEY,
         "q": query,
         "part": "snippet",
+        "fields": SEARCH_FIELDS,
         "type": "video",
-        "maxResults": min(max_results, 50),
+        "maxResults": min(max_results, _PAGE_SIZE),
         "order": order,
     }
     
     # Date filtering
     if published_after:
         if isinstance(published_after, datetime):
-            params["publishedAfter"] = published_after.strftime("%Y-%m-%dT%H:%M:%SZ")
+            params["publishedAfter"] = _to_iso8601(published_after)
         else:
             params["publishedAfter"] = published_after
-    if published_before:
-        if isinstance(published_before, datetime):
-            params["publishedBefore"] = published_before.strftime("%Y-%m-%dT%H:%M:%SZ")
-        else:
-            params["publishedBefore"] = published_before
-    
-    # Channel filter
-    if channel_id:
-        params["channelId"] = channel_id
-    
-    # Region/language
-    if region_code:
-        params["regionCode"] = region_code
-    if relevance_language:
-        params["relevanceLanguage"] = relevance_language
-    
-    # Safe search
-    if safe_search:
-        params["safeSearch"] = safe_search
-    
-    # Video filters
-    if video_caption:
-        params["videoCaption"] = video_caption
-    if video_category_id:
-        params["videoCategoryId"] = video_category_id
-    if video_definition:
-        params["videoDefinition"] = video_definition
-    if video_dimension:
-        params["videoDimension"] = video_dimension
-    if video_duration:
-        params["videoDuration"] = video_duration
-    if video_embeddable:
-        params["videoEmbeddable"] = video_embeddable
-    if video_license:
-        params["videoLicense"] = video_license
-    if video_syndicated:
-        params["videoSyndicated"] = video_syndicated
-    if video_type:
-        params["videoType"] = video_type
-    
-    # Live events
-    if event_type:
-        params["eventType"] = event_type
-    
-    # Location-based search
-    if location:
-        params["location"] = location
-        params["locationRadius"] = location_radius or "50km"
     
-    # Topic
-    if topic_id:
-        params["topicId"] = topic_id
-    
-    response = requests.get(YOUTUBE_SEARCH_URL, params=params)
-    response.raise_for_status()
-    data = response.json()
+    _apply_search_filters(params, filters)
     
+    # Page tokens are opaque and each comes from the previous response, so
+    # pages are fetched one after another.
     videos = []
-    for item in data.get("items", []):
-        snippet = item.get("snippet", {})
-        videos.append({
-            "video_id": item["id"]["videoId"],
-            "title": snippet.get("title", ""),
-            "description": snippet.get("description", ""),
-            "channel_title": snippet.get("channelTitle", ""),
-            "channel_id": snippet.get("channelId", ""),
-            "published_at": snippet.get("publishedAt", ""),
-            "thumbnail": snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
-            "url": f"https://youtube.com/watch?v={item['id']['videoId']}",
-        })
+    while True:
+        data = _api_get(YOUTUBE_SEARCH_URL, "search", params)
+        videos.extend(
+            _snippet_row(item["id"]["videoId"], item.get("snippet", {}))
+            for item in data.get("items", ())
+        )
+        
+        remaining = max_results - len(videos)
+        next_token = data.get("nextPageToken")
+        if remaining <= 0 or not next_token or not data.get("items"):
+            break
+        params = dict(params, pageToken=next_token, maxResults=min(remaining, _PAGE_SIZE))
     
-    return videos
+    return videos[:max_results]
 
 
 def get_video_details(video_ids: List[str]) -> List[Dict[str, Any]]:
@@ -179,46 +316,68 @@ def get_video_details(video_ids: List[str]) -> List[Dict[str, Any]]:
     Get detailed metadata for specific videos (views, duration, etc).
     
     Args:
-        video_ids: List of YouTube video IDs
+        video_ids: List of YouTube video IDs (any number; requested in
+            batches of 50, concurrently when there are several)
         
     Returns:
-        List of detailed video metadata
+        List of detailed video metadata, in video_ids order
     """
     validate_youtube_api()
     
-    # API accepts up to 50 IDs at once
+    batches = [video_ids[i:i + _PAGE_SIZE] for i in range(0, len(video_ids), _PAGE_SIZE)]
+    if len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(batches), _DETAIL_WORKERS)) as pool:
+            videos = [v for batch in pool.map(_video_details_batch, batches) for v in batch]
+    elif batches:
+        videos = _video_details_batch(batches[0])
+    else:
+        videos = []
+    
+    # A cached body may come from a request that listed the IDs differently.
+    position = {vid: i for i, vid in enumerate(video_ids)}
+    videos.sort(key=lambda v: position.get(v["video_id"], len(position)))
+    return videos
+
+
+def _video_details_batch(video_ids: List[str]) -> List[Dict[str, Any]]:
+    """One videos.list request for up to 50 IDs."""
     params = {
         "key": YOUTUBE_API_KEY,
-        "id": ",".join(video_ids[:50]),
+        "id": ",".join(video_ids),
         "part": "snippet,statistics,contentDetails",
+        "fields": VIDEOS_FIELDS,
     }
     
-    response = requests.get(YOUTUBE_VIDEOS_URL, params=params)
-    response.raise_for_status()
-    data = response.json()
-    
-    videos = []
-    for item in data.get("items", []):
-        snippet = item.get("snippet", {})
-        stats = item.get("statistics", {})
-        content = item.get("contentDetails", {})
-        
-        videos.append({
-            "video_id": item["id"],
-            "title": snippet.get("title", ""),
-            "description": snippet.get("description", ""),
-            "channel_title": snippet.get("channelTitle", ""),
-            "channel_id": snippet.get("channelId", ""),
-            "published_at": snippet.get("publishedAt", ""),
-            "thumbnail": snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
-            "url": f"https://youtube.com/watch?v={item['id']}",
-            "views": int(stats.get("viewCount", 0)),
-            "likes": int(stats.get("likeCount", 0)),
-            "comments": int(stats.get("commentCount", 0)),
-            "duration": content.get("duration", ""),  # ISO 8601 format
-        })
-    
-    return videos
+    # The same ID set in any order is the same request.
+    cache_key = dict(_cache_params(params), id=",".join(sorted(video_ids)))
+    data = _api_get(YOUTUBE_VIDEOS_URL, "videos", params, cache_key=cache_key)
+    return [_detail_row(item) for item in data.get("items", ())]
+
+
+def _snippet_row(video_id: str, snippet: Dict[str, Any]) -> Dict[str, Any]:
+    """Result row fields shared by search and videos responses."""
+    get = snippet.get
+    return {
+        "video_id": video_id,
+        "title": get("title", ""),
+        "description": get("description", ""),
+        "channel_title": get("channelTitle", ""),
+        "channel_id": get("channelId", ""),
+        "published_at": get("publishedAt", ""),
+        "thumbnail": get("thumbnails", {}).get("high", {}).get("url", ""),
+        "url": _WATCH_URL + video_id,
+    }
+
+
+def _detail_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """A videos.list item as a result row, with statistics and duration."""
+    row = _snippet_row(item["id"], item.get("snippet", {}))
+    stats = item.get("statistics", {}).get
+    row["views"] = int(stats("viewCount", 0))
+    row["likes"] = int(stats("likeCount", 0))
+    row["comments"] = int(stats("commentCount", 0))
+    row["duration"] = item.get("contentDetails", {}).get("duration", "")  # ISO 8601 format
+    return row
 
 
 def search_recent(
@@ -318,17 +477,55 @@ def search_recent(
     return detailed
 
 
+async def search_recent_async(query: str, **kwargs) -> List[Dict[str, Any]]:
+    """Coroutine form of search_recent(); takes the same keyword arguments.
+
+    The two API calls are dependent (details need the search's IDs), so
+    they run back to back on the loop's default executor, leaving the
+    loop free for other work such as transcript fetches.
+    """
+    import asyncio
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(search_recent, query, **kwargs))
+
+
+def _parse_duration(iso_duration: str) -> Optional[tuple]:
+    """
+    Split a 'PT#H#M#S' duration into (hours, minutes, seconds).
+    
+    A single pass accumulating digits; for strings this short it is faster
+    than a regex match plus an int() per group. Stops at the first
+    character outside the grammar.
+    
+    Returns:
+        The three components (missing ones are 0), or None if the string
+        doesn't start with 'PT'
+    """
+    if not iso_duration.startswith("PT"):
+        return None
+    hours = minutes = seconds = value = 0
+    for ch in iso_duration[2:]:
+        if "0" <= ch <= "9":
+            value = value * 10 + (ord(ch) - 48)
+        elif ch == "H":
+            hours, value = value, 0
+        elif ch == "M":
+            minutes, value = value, 0
+        elif ch == "S":
+            seconds, value = value, 0
+        else:
+            break
+    return hours, minutes, seconds
+
+
 def format_duration(iso_duration: str) -> str:
     """Convert ISO 8601 duration to human readable format."""
-    import re
-    match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', iso_duration)
-    if not match:
+    parsed = _parse_duration(iso_duration)
+    if parsed is None:
         return iso_duration
     
-    hours, minutes, seconds = match.groups()
-    hours = int(hours) if hours else 0
-    minutes = int(minutes) if minutes else 0
-    seconds = int(seconds) if seconds else 0
+    hours, minutes, seconds = parsed
     
     if hours:
         return f"{hours}h {minutes}m"
@@ -21,9 +21,13 @@ def _isolated_proxy_state():
     """Reset proxy/pool singletons between tests so state never leaks."""
     proxy_pool.reset_pool()
     transcript_module._initialized = False
+    transcript_module.clear_transcript_cache()
+    transcript_module._primary_breaker.reset()
     yield
     proxy_pool.reset_pool()
     transcript_module._initialized = False
+    transcript_module.clear_transcript_cache()
+    transcript_module._primary_breaker.reset()
 
 
 @pytest.fixture
@@ -39,9 +43,11 @@ def library(tmp_path):
     return TranscriptLibrary(data_dir=str(data_dir))
 
 
-@pytest.fixture
-def populated_library(library):
-    """Library pre-loaded with sample transcripts."""
+@pytest.fixture(scope="session")
+def _template_library_dir(tmp_path_factory):
+    """Build the sample library once; populated_library copies it per test."""
+    data_dir = tmp_path_factory.mktemp("template") / ".filmot_data"
+    library = TranscriptLibrary(data_dir=str(data_dir))
     library.save(
         video_id="abc12345678",
         topic="test-topic",
@@ -78,4 +84,12 @@ def populated_library(library):
             "duration_seconds": 600,
         },
     )
-    return library
+    return data_dir
+
+
+@pytest.fixture
+def populated_library(tmp_path, _template_library_dir):
+    """Library pre-loaded with sample transcripts."""
+    data_dir = tmp_path / ".filmot_data"
+    shutil.copytree(_template_library_dir, data_dir)
+    return TranscriptLibrary(data_dir=str(data_dir))
@@ -22,23 +22,24 @@ from filmot.aws_transcribe import (
 
 class TestCheckDependencies:
 
-    @patch("filmot.aws_transcribe.HAS_BOTO3", True)
-    @patch("subprocess.run")
-    def test_all_ok(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0, stdout="2024.01.01")
+    def test_all_ok(self, monkeypatch):
+        monkeypatch.setattr("filmot.aws_transcribe.HAS_BOTO3", True)
+        monkeypatch.setattr(
+            "subprocess.run", lambda *a, **k: MagicMock(returncode=0, stdout="2024.01.01")
+        )
         ok, msg = check_dependencies()
         assert ok is True
         assert msg == ""
 
-    @patch("filmot.aws_transcribe.HAS_BOTO3", False)
-    def test_missing_boto3(self):
+    def test_missing_boto3(self, monkeypatch):
+        monkeypatch.setattr("filmot.aws_transcribe.HAS_BOTO3", False)
         ok, msg = check_dependencies()
         assert ok is False
         assert "boto3" in msg
 
-    @patch("filmot.aws_transcribe.HAS_BOTO3", True)
-    @patch("subprocess.run", side_effect=FileNotFoundError)
-    def test_missing_ytdlp(self, mock_run):
+    def test_missing_ytdlp(self, monkeypatch):
+        monkeypatch.setattr("filmot.aws_transcribe.HAS_BOTO3", True)
+        monkeypatch.setattr("subprocess.run", MagicMock(side_effect=FileNotFoundError))
         ok, msg = check_dependencies()
         assert ok is False
         assert "yt-dlp" in msg
@@ -119,7 +120,8 @@ class TestStartTranscriptionJob:
 
 class TestWaitForTranscription:
 
-    def test_completes_after_polls(self):
+    def test_completes_after_polls(self, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda _: None)  # skip real sleep
         mock_client = MagicMock()
         # First call: IN_PROGRESS, second: COMPLETED
         mock_client.get_transcription_job.side_effect = [
@@ -132,8 +134,7 @@ class TestWaitForTranscription:
             },
         ]
 
-        with patch("time.sleep"):  # skip real sleep
-            uri = wait_for_transcription(mock_client, "job123", poll_interval=1)
+        uri = wait_for_transcription(mock_client, "job123", poll_interval=1)
 
         assert uri == "https://aws.example.com/transcript.json"
         assert mock_client.get_transcription_job.call_count == 2
@@ -150,30 +151,28 @@ class TestWaitForTranscription:
         with pytest.raises(AWSTranscribeError, match="Bad audio"):
             wait_for_transcription(mock_client, "job123")
 
-    def test_raises_on_timeout(self):
+    def test_raises_on_timeout(self, monkeypatch):
+        monkeypatch.setattr("time.sleep", lambda _: None)
+        monkeypatch.setattr("time.monotonic", iter([0, 0, 999]).__next__)
         mock_client = MagicMock()
         mock_client.get_transcription_job.return_value = {
             "TranscriptionJob": {"TranscriptionJobStatus": "IN_PROGRESS"}
         }
 
-        with patch("time.sleep"):
-            with patch("time.time", side_effect=[0, 0, 999]):
-                with pytest.raises(AWSTranscribeError, match="timed out"):
-                    wait_for_transcription(mock_client, "job123", timeout=10)
+        with pytest.raises(AWSTranscribeError, match="timed out"):
+            wait_for_transcription(mock_client, "job123", timeout=10)
 
 
 # ── fetch_transcript_text ────────────────────────────────────────
 
 class TestFetchTranscriptText:
 
-    @patch("filmot.aws_transcribe.requests.get")
-    def test_parses_aws_json(self, mock_get):
+    def test_parses_aws_json(self, monkeypatch):
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
             "results": {"transcripts": [{"transcript": "Hello from AWS"}]}
         }
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
+        monkeypatch.setattr("filmot.aws_transcribe.requests.get", lambda uri: mock_resp)
 
         text = fetch_transcript_text("https://aws.example.com/t.json")
         assert text == "Hello from AWS"
@@ -7,16 +7,27 @@ from click.testing import CliRunner
 from filmot.cli import cli  # The click.Group, not the main() wrapper
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
+    # CliRunner keeps no state between invoke() calls, so one is enough.
     return CliRunner()
 
 
+@pytest.fixture(scope="module")
+def help_results(runner):
+    """--help output for each command, rendered once for the whole module."""
+    return {
+        "root": runner.invoke(cli, ["--help"]),
+        "search": runner.invoke(cli, ["search", "--help"]),
+        "transcript": runner.invoke(cli, ["transcript", "--help"]),
+    }
+
+
 class TestCLIEntryPoint:
     """Basic smoke tests for the CLI."""
 
-    def test_help(self, runner):
-        result = runner.invoke(cli, ["--help"])
+    def test_help(self, help_results):
+        result = help_results["root"]
         assert result.exit_code == 0
         assert "Filmot" in result.output or "filmot" in result.output.lower()
 
@@ -25,18 +36,40 @@ class TestCLIEntryPoint:
         assert result.exit_code == 0
         assert "0.3.0" in result.output
 
-    def test_search_help(self, runner):
-        result = runner.invoke(cli, ["search", "--help"])
+    def test_search_help(self, help_results):
+        result = help_results["search"]
         assert result.exit_code == 0
         assert "--bulk-download" in result.output
         assert "--fallback" in result.output
 
-    def test_transcript_help(self, runner):
-        result = runner.invoke(cli, ["transcript", "--help"])
+    def test_transcript_help(self, help_results):
+        result = help_results["transcript"]
         assert result.exit_code == 0
         assert "--fallback" in result.output
 
 
+class TestWatchlistAdd:
+    """Tests for `watchlist add` with several IDs."""
+
+    def test_adds_all_with_one_write(self, runner, tmp_path):
+        from filmot.watchlist import Watchlist
+
+        wl = Watchlist(storage_dir=str(tmp_path / ".filmot_data"))
+        writes = []
+        save_file = wl._save_file
+        wl._save_file = lambda path, data: (writes.append(path), save_file(path, data))
+        client = MagicMock()
+        client.get_videos.side_effect = lambda vid: [{"title": f"T {vid}"}]
+
+        with patch("filmot.cli.FilmotClient", return_value=client), \
+                patch("filmot.watchlist.get_watchlist", return_value=wl):
+            result = runner.invoke(cli, ["watchlist", "add", "abc12345678", "def12345678"])
+
+        assert result.exit_code == 0
+        assert [i["video_id"] for i in wl.get_watchlist()] == ["abc12345678", "def12345678"]
+        assert writes == [wl.watchlist_file]
+
+
 class TestMainModule:
     """Test python -m filmot entry point."""
 
@@ -75,6 +75,22 @@ class TestSaveAndGet:
         result = library.get("vid123456789", "ml")
         assert result["metadata"]["title"] == "Cool Video"
 
+    def test_metadata_with_non_string_keys(self, library):
+        library.save("vid123456789", "ml", "text", metadata={"chapters": {1: "Intro"}})
+        assert library.get("vid123456789", "ml")["metadata"]["chapters"] == {"1": "Intro"}
+
+    def test_failed_write_keeps_previous_file(self, library, monkeypatch):
+        library.save("vid123456789", "ml", "first")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("filmot.library.os.replace", fail_replace)
+        with pytest.raises(OSError):
+            library.save("vid123456789", "ml", "second")
+        assert library.get("vid123456789", "ml")["transcript"] == "first"
+        assert not list((library.transcripts_dir / "ml").glob("*.tmp"))
+
     def test_overwrite(self, library):
         library.save("vid123456789", "ml", "first")
         library.save("vid123456789", "ml", "second")
@@ -162,6 +178,33 @@ class TestSearch:
         results = populated_library.search("neural")
         assert results[0]["match_count"] >= 1
 
+    def test_single_word_respects_word_boundaries(self, library):
+        library.save("vid123456789", "t", "more ore before ore_x ore. Ore")
+        results = library.search("ore")
+        assert results[0]["match_count"] == 3
+
+    def test_single_word_matches_regex_spans(self, library):
+        import re
+        text = "aaa aa a-aa aa_ aa1 (aa) aa"
+        pattern = re.compile(r'(?<!\w)aa(?!\w)')
+        expected = [m.span() for m in pattern.finditer(text)]
+        assert list(library._match_spans(text, "aa")) == expected
+
+    def test_substring_matches_inside_words(self, library):
+        library.save("vid123456789", "t", "more ore before ore_x ore. Ore")
+        results = library.search("ore", substring=True)
+        assert results[0]["match_count"] == 6
+
+    def test_match_count_exact_but_contexts_capped(self, library):
+        library.save("vid123456789", "t", " ".join(["spam"] * 12))
+        result = library.search("spam")[0]
+        assert result["match_count"] == 12
+        assert len(result["matches"]) == 5
+
+    def test_find_matches_max_matches(self, library):
+        matches = library._find_matches("x " * 50, "x", context_chars=2, max_matches=3)
+        assert len(matches) == 3
+
 
 # ── get_context ───────────────────────────────────────────────────
 
@@ -181,6 +224,18 @@ class TestGetContext:
         ctx = library.get_context("nonexistent")
         assert ctx == ""
 
+    def test_headers_per_video(self, populated_library):
+        ctx = populated_library.get_context("test-topic")
+        assert ctx.count("VIDEO: ") == 2
+        assert "ID: abc12345678" in ctx
+        assert "CHANNEL: AI Channel" in ctx
+
+    def test_truncation_marker(self, library):
+        library.save("vid123456789", "long", "word " * 1000)
+        ctx = library.get_context("long", max_chars=1000)
+        assert ctx.endswith("[TRUNCATED]")
+        assert len(ctx) <= 1000 + len("\n\n[TRUNCATED]")
+
 
 # ── Delete ────────────────────────────────────────────────────────
 
@@ -223,3 +278,105 @@ class TestStats:
         s = library.stats()
         assert s["total_topics"] == 0
         assert s["total_transcripts"] == 0
+
+
+# ── Cross-topic index ─────────────────────────────────────────────
+
+class TestTopicIndex:
+    """Tests for the lazy video ID -> topic index."""
+
+    def test_save_after_index_built(self, populated_library):
+        assert populated_library.get("new12345678") is None
+        populated_library.save("new12345678", "fresh", "late addition")
+        assert populated_library.get("new12345678")["topic"] == "fresh"
+
+    def test_delete_by_topic_updates_index(self, populated_library):
+        populated_library.save("abc12345678", "other-topic", "cross-posted")
+        assert populated_library.exists("abc12345678")
+        populated_library.delete("abc12345678", "test-topic")
+        assert populated_library.get("abc12345678")["topic"] == "other-topic"
+
+    def test_delete_topic_updates_index(self, populated_library):
+        assert populated_library.exists("ghi12345678")
+        populated_library.delete_topic("other-topic")
+        assert populated_library.exists("ghi12345678") is False
+
+    def test_sees_saves_from_another_instance(self, populated_library):
+        assert populated_library.exists("abc12345678")  # index built
+        other = TranscriptLibrary(data_dir=str(populated_library.data_dir))
+        other.save("new12345678", "fresh", "saved elsewhere")
+        assert populated_library.exists("new12345678")
+        assert populated_library.get("new12345678")["transcript"] == "saved elsewhere"
+
+    def test_miss_trusts_index(self, populated_library, monkeypatch):
+        assert populated_library.exists("abc12345678")  # index built
+        rescans = []
+
+        def no_probe(topic_dir, safe_id):
+            raise AssertionError(f"probed {topic_dir.name} for {safe_id}")
+
+        monkeypatch.setattr(populated_library, "_find_file", no_probe)
+        monkeypatch.setattr(populated_library, "_index_topic", rescans.append)
+        assert populated_library.exists("zzz12345678") is False
+        assert populated_library.get("abc12345678")["video_id"] == "abc12345678"
+        assert rescans == []
+
+    def test_rescans_only_changed_topic(self, populated_library, monkeypatch):
+        assert populated_library.exists("abc12345678")
+        other = TranscriptLibrary(data_dir=str(populated_library.data_dir))
+        other.save("new12345678", "other-topic", "saved elsewhere")
+        rescans = []
+        index_topic = populated_library._index_topic
+        monkeypatch.setattr(
+            populated_library, "_index_topic", lambda name: (rescans.append(name), index_topic(name))
+        )
+        assert populated_library.exists("new12345678")
+        assert rescans == ["other-topic"]
+
+    def test_file_removed_externally(self, populated_library):
+        assert populated_library.exists("abc12345678")
+        path = populated_library.transcripts_dir / "test-topic" / "abc12345678.json"
+        path.unlink()
+        assert populated_library.get("abc12345678") is None
+        assert populated_library.delete("abc12345678") is False
+
+
+# ── Compressed storage ────────────────────────────────────────────
+
+class TestCompressedStorage:
+    """Tests for zstd-compressed transcript files."""
+
+    @pytest.fixture
+    def zlibrary(self, tmp_path):
+        pytest.importorskip("zstandard")
+        return TranscriptLibrary(data_dir=str(tmp_path / ".filmot_data"), compress=True)
+
+    def test_save_writes_zst(self, zlibrary):
+        path = zlibrary.save("vid123456789", "ml", "compressed text")
+        assert path.name == "vid123456789.json.zst"
+        assert zlibrary.get("vid123456789", "ml")["transcript"] == "compressed text"
+        assert zlibrary.get("vid123456789")["transcript"] == "compressed text"
+
+    def test_reads_mixed_formats(self, zlibrary):
+        plain = TranscriptLibrary(data_dir=str(zlibrary.data_dir), compress=False)
+        plain.save("old12345678", "ml", "plain machine text")
+        zlibrary.save("new12345678", "ml", "zstd machine text")
+        assert zlibrary.list_topics()[0]["count"] == 2
+        assert len(zlibrary.search("machine")) == 2
+        assert zlibrary.stats()["total_transcripts"] == 2
+
+    def test_corrupt_zst_is_skipped(self, zlibrary):
+        zlibrary.save("good1234567", "ml", "machine text")
+        (zlibrary.transcripts_dir / "ml" / "bad12345678.json.zst").write_bytes(b"not zstd at all")
+        assert [r["video_id"] for r in zlibrary.search("machine")] == ["good1234567"]
+        assert [t["video_id"] for t in zlibrary.list_transcripts("ml")] == ["good1234567"]
+        with pytest.raises(IOError):
+            zlibrary.get("bad12345678", "ml")
+
+    def test_resave_replaces_other_format(self, zlibrary):
+        plain = TranscriptLibrary(data_dir=str(zlibrary.data_dir), compress=False)
+        plain.save("vid123456789", "ml", "first")
+        zlibrary.save("vid123456789", "ml", "second")
+        assert len(zlibrary.list_transcripts("ml")) == 1
+        assert zlibrary.delete("vid123456789") is True
+        assert zlibrary.exists("vid123456789") is False
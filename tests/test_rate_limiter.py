@@ -0,0 +1,241 @@
+"""Tests for filmot.rate_limiter module (in-process limiters only)."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import filmot.rate_limiter as rate_limiter_module
+from filmot.rate_limiter import RateLimiter, AdaptiveRateLimiter, CircuitBreaker
+
+
+# ── RateLimiter ───────────────────────────────────────────────────
+
+class TestRateLimiter:
+    """Tests for the token bucket RateLimiter."""
+
+    def test_burst_is_immediate(self):
+        rl = RateLimiter(requests_per_second=10, burst_size=5)
+        start = time.monotonic()
+        for _ in range(5):
+            assert rl.acquire() == 0.0
+        assert time.monotonic() - start < 0.05
+
+    def test_sustained_rate_after_burst(self):
+        rl = RateLimiter(requests_per_second=50, burst_size=2)
+        start = time.monotonic()
+        for _ in range(7):
+            rl.acquire()
+        # 2 from the burst, then 5 more at 50/s
+        assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+
+    def test_concurrent_acquires_respect_rate(self):
+        rl = RateLimiter(requests_per_second=100, burst_size=5)
+
+        def worker():
+            for _ in range(5):
+                rl.acquire()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 20 requests: 5 from the burst, 15 more at 100/s
+        assert time.monotonic() - start == pytest.approx(0.15, abs=0.07)
+        assert rl.stats()["total_requests"] == 20
+
+    def test_wall_clock_jump_does_not_stall(self):
+        rl = RateLimiter(requests_per_second=10, burst_size=2)
+        rl.acquire()
+        # A backwards NTP step must not turn the next slot into a long sleep.
+        with patch("time.time", return_value=time.time() - 3600):
+            start = time.monotonic()
+            rl.acquire()
+            assert time.monotonic() - start < 0.05
+
+    def test_acquire_async_paces_coroutines(self):
+        import asyncio
+
+        rl = RateLimiter(requests_per_second=50, burst_size=2)
+
+        async def run():
+            await asyncio.gather(*(rl.acquire_async() for _ in range(7)))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+        assert rl.stats()["total_requests"] == 7
+
+    def test_acquire_n_waits_once_for_the_batch(self):
+        rl = RateLimiter(requests_per_second=50, burst_size=4)
+        assert rl.acquire_n(4) == 0.0
+        start = time.monotonic()
+        rl.acquire_n(3)
+        assert time.monotonic() - start == pytest.approx(0.06, abs=0.03)
+        s = rl.stats()
+        assert s["total_requests"] == 7
+        assert s["total_waits"] == 1
+
+    def test_acquire_n_rejects_out_of_range(self):
+        rl = RateLimiter(requests_per_second=10, burst_size=3)
+        with pytest.raises(ValueError):
+            rl.acquire_n(0)
+        with pytest.raises(ValueError):
+            rl.acquire_n(4)
+
+    def test_stats_track_waits(self):
+        rl = RateLimiter(requests_per_second=100, burst_size=1)
+        rl.acquire()
+        rl.acquire()
+        s = rl.stats()
+        assert s["total_requests"] == 2
+        assert s["total_waits"] == 1
+        assert s["total_wait_time"] > 0
+
+    def test_reset_stats(self):
+        rl = RateLimiter(requests_per_second=100, burst_size=5)
+        rl.acquire()
+        rl.reset_stats()
+        assert rl.stats()["total_requests"] == 0
+
+
+# ── AdaptiveRateLimiter ───────────────────────────────────────────
+
+class TestAdaptiveRateLimiter:
+    """Tests for backoff handling in AdaptiveRateLimiter."""
+
+    def test_rate_limit_adds_backoff(self):
+        rl = AdaptiveRateLimiter(requests_per_second=20, burst_size=5)
+        rl.report_rate_limit()
+        assert rl.backoff_factor == 2.0
+        start = time.monotonic()
+        rl.acquire()
+        assert time.monotonic() - start == pytest.approx(0.05, abs=0.03)
+
+    def test_backoff_slows_concurrent_callers(self):
+        def run(rl):
+            def worker():
+                for _ in range(5):
+                    rl.acquire()
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            start = time.monotonic()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            return time.monotonic() - start
+
+        baseline = run(AdaptiveRateLimiter(requests_per_second=100, burst_size=1))
+        backed_off = AdaptiveRateLimiter(requests_per_second=100, burst_size=1)
+        backed_off.backoff_factor = 4.0
+        # 20 requests spaced 10ms apart vs 40ms apart
+        assert baseline == pytest.approx(0.19, abs=0.07)
+        assert run(backed_off) == pytest.approx(0.79, abs=0.15)
+
+    def test_success_decays_backoff(self):
+        rl = AdaptiveRateLimiter(requests_per_second=20, burst_size=5)
+        rl.report_rate_limit()
+        rl.report_success()
+        assert rl.backoff_factor == pytest.approx(1.8)
+        assert rl.consecutive_errors == 0
+
+    def test_success_wakes_backoff_waiter(self):
+        rl = AdaptiveRateLimiter(requests_per_second=10, burst_size=5)
+        rl.backoff_factor = rl.max_backoff  # 0.9s of extra wait
+
+        def recover():
+            time.sleep(0.05)
+            for _ in range(25):
+                rl.report_success()
+
+        t = threading.Thread(target=recover)
+        start = time.monotonic()
+        t.start()
+        rl.acquire()
+        t.join()
+        assert time.monotonic() - start < 0.5
+
+    def test_no_backoff_no_extra_wait(self):
+        rl = AdaptiveRateLimiter(requests_per_second=20, burst_size=5)
+        assert rl.acquire() == 0.0
+
+
+# ── CircuitBreaker ────────────────────────────────────────────────
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_threshold(self):
+        cb = CircuitBreaker(failure_threshold=3, window=60, reset_timeout=30)
+        for _ in range(2):
+            cb.record_failure()
+        assert cb.allow()
+        cb.record_failure()
+        assert cb.state == CircuitBreaker.OPEN
+        assert not cb.allow()
+
+    def test_old_failures_fall_out_of_window(self):
+        cb = CircuitBreaker(failure_threshold=2, window=10, reset_timeout=30)
+        now = [100.0]
+        cb._clock = lambda: now[0]
+        cb.record_failure()
+        now[0] += 11
+        cb.record_failure()
+        assert cb.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_one_trial(self):
+        cb = CircuitBreaker(failure_threshold=1, window=60, reset_timeout=5)
+        now = [0.0]
+        cb._clock = lambda: now[0]
+        cb.record_failure()
+        assert not cb.allow()
+        now[0] += 5
+        assert cb.allow()
+        assert not cb.allow()
+        cb.record_success()
+        assert cb.state == CircuitBreaker.CLOSED
+        assert cb.allow()
+
+    def test_failed_trial_reopens(self):
+        cb = CircuitBreaker(failure_threshold=1, window=60, reset_timeout=5)
+        now = [0.0]
+        cb._clock = lambda: now[0]
+        cb.record_failure()
+        now[0] += 5
+        assert cb.allow()
+        cb.record_failure()
+        assert cb.state == CircuitBreaker.OPEN
+        assert not cb.allow()
+
+
+# ── get_rate_limiter ──────────────────────────────────────────────
+
+class TestGetRateLimiter:
+    """Tests for the process-wide limiter singleton."""
+
+    def test_concurrent_first_calls_share_one_instance(self, monkeypatch):
+        monkeypatch.setattr(rate_limiter_module, "_rate_limiter", None)
+        barrier = threading.Barrier(8)
+        seen = []
+
+        def worker():
+            barrier.wait()
+            seen.append(rate_limiter_module.get_rate_limiter(shared=False))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(rl) for rl in seen}) == 1
+
+    def test_youtube_quota_charges_per_call_cost(self, monkeypatch):
+        monkeypatch.setattr(rate_limiter_module, "_youtube_quota", None)
+        monkeypatch.setattr(rate_limiter_module, "YOUTUBE_DAILY_QUOTA", 101)
+        assert rate_limiter_module.acquire_youtube_quota("search") == 0.0
+        assert rate_limiter_module.acquire_youtube_quota("videos") == 0.0
+        assert rate_limiter_module._youtube_quota.stats()["total_requests"] == 101
@@ -1,6 +1,7 @@
 """Tests for filmot.transcript module."""
 
 import pytest
+from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import filmot.transcript as transcript_module
@@ -10,51 +11,54 @@ from filmot.transcript import (
     format_timestamp,
     get_transcript,
     get_transcript_with_fallback,
+    get_transcript_with_timestamps,
+    search_in_transcript,
+    Segment,
 )
 
 
-# ── extract_video_id ──────────────────────────────────────────────
-
-class TestExtractVideoId:
-    """Tests for extract_video_id()."""
-
-    def test_plain_id(self):
-        assert extract_video_id("dQw4w9WgXcQ") == "dQw4w9WgXcQ"
-
-    def test_id_with_hyphens_underscores(self):
-        assert extract_video_id("-O1bjFPgRQM") == "-O1bjFPgRQM"
-        assert extract_video_id("a_b-c_d-e_f") == "a_b-c_d-e_f"
+@dataclass(frozen=True)
+class Seg:
+    """Stand-in for a fetched transcript snippet."""
+    text: str
+    start: float
+    duration: float
 
-    def test_standard_url(self):
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
 
-    def test_short_url(self):
-        url = "https://youtu.be/dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
+class FakeTranscript(list):
+    """Stand-in for youtube_transcript_api's FetchedTranscript."""
 
-    def test_url_with_extra_params(self):
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=120&list=PLxyz"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
+    def __init__(self, segments, video_id="abc12345678", language_code="en", is_generated=True):
+        super().__init__(segments)
+        self.video_id = video_id
+        self.language_code = language_code
+        self.is_generated = is_generated
 
-    def test_embed_url(self):
-        url = "https://www.youtube.com/embed/dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
 
-    def test_old_v_url(self):
-        url = "https://www.youtube.com/v/dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
-
-    def test_no_scheme(self):
-        url = "youtube.com/watch?v=dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
+# ── extract_video_id ──────────────────────────────────────────────
 
-    def test_garbage_passthrough(self):
-        """Non-matching input is returned as-is."""
-        assert extract_video_id("not-a-video") == "not-a-video"
+class TestExtractVideoId:
+    """Tests for extract_video_id()."""
 
-    def test_empty_string(self):
-        assert extract_video_id("") == ""
+    @pytest.mark.parametrize("video_input, expected", [
+        ("dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("-O1bjFPgRQM", "-O1bjFPgRQM"),
+        ("a_b-c_d-e_f", "a_b-c_d-e_f"),
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=120&list=PLxyz", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/v/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        # Non-matching input is returned as-is
+        ("not-a-video", "not-a-video"),
+        ("", ""),
+    ], ids=[
+        "plain_id", "leading_hyphen", "underscores", "standard_url", "short_url",
+        "extra_params", "embed_url", "old_v_url", "no_scheme", "garbage", "empty",
+    ])
+    def test_extracts(self, video_input, expected):
+        assert extract_video_id(video_input) == expected
 
 
 # ── format_timestamp ──────────────────────────────────────────────
@@ -62,20 +66,15 @@ class TestExtractVideoId:
 class TestFormatTimestamp:
     """Tests for format_timestamp()."""
 
-    def test_zero(self):
-        assert format_timestamp(0) == "0:00"
-
-    def test_seconds_only(self):
-        assert format_timestamp(45) == "0:45"
-
-    def test_minutes_and_seconds(self):
-        assert format_timestamp(125) == "2:05"
-
-    def test_hours(self):
-        assert format_timestamp(3661) == "1:01:01"
-
-    def test_float_input(self):
-        assert format_timestamp(90.7) == "1:30"
+    @pytest.mark.parametrize("seconds, expected", [
+        (0, "0:00"),
+        (45, "0:45"),
+        (125, "2:05"),
+        (3661, "1:01:01"),
+        (90.7, "1:30"),
+    ], ids=["zero", "seconds_only", "minutes_and_seconds", "hours", "float_input"])
+    def test_formats(self, seconds, expected):
+        assert format_timestamp(seconds) == expected
 
 
 # ── get_transcript (mocked) ──────────────────────────────────────
@@ -89,15 +88,9 @@ class TestGetTranscript:
         mock_api = MagicMock()
         mock_get_api.return_value = mock_api
 
-        # Build a mock transcript object that is iterable
-        seg1 = MagicMock(text="Hello", start=0.0, duration=1.5)
-        seg2 = MagicMock(text="world", start=1.5, duration=1.0)
-        mock_transcript = MagicMock()
-        mock_transcript.__iter__ = MagicMock(return_value=iter([seg1, seg2]))
-        mock_transcript.video_id = "abc12345678"
-        mock_transcript.language_code = "en"
-        mock_transcript.is_generated = True
-        mock_api.fetch.return_value = mock_transcript
+        mock_api.fetch.return_value = FakeTranscript(
+            [Seg("Hello", 0.0, 1.5), Seg("world", 1.5, 1.0)]
+        )
 
         result = get_transcript("abc12345678")
 
@@ -106,6 +99,7 @@ class TestGetTranscript:
         assert result["language"] == "en"
         assert result["is_generated"] is True
         assert result["segment_count"] == 2
+        assert result["segments"][0] == {"text": "Hello", "start": 0.0, "duration": 1.5}
         assert "Hello" in result["full_text"]
         assert "world" in result["full_text"]
 
@@ -139,17 +133,39 @@ class TestGetTranscript:
         mock_api = MagicMock()
         mock_get_api.return_value = mock_api
 
-        seg = MagicMock(text="Test", start=0.0, duration=1.0)
-        mock_transcript = MagicMock()
-        mock_transcript.__iter__ = MagicMock(return_value=iter([seg]))
-        mock_transcript.video_id = "dQw4w9WgXcQ"
-        mock_transcript.language_code = "en"
-        mock_transcript.is_generated = False
-        mock_api.fetch.return_value = mock_transcript
+        mock_api.fetch.return_value = FakeTranscript(
+            [Seg("Test", 0.0, 1.0)], video_id="dQw4w9WgXcQ", is_generated=False
+        )
 
         result = get_transcript("https://youtu.be/dQw4w9WgXcQ")
         assert result["video_id"] == "dQw4w9WgXcQ"
 
+    @patch("filmot.transcript._backoff_delay", return_value=0)
+    @patch("filmot.transcript._fetch_transcript_from_api")
+    def test_direct_route_retried_on_rate_limit(self, mock_fetch, _delay):
+        mock_fetch.side_effect = [
+            Exception("429 Too Many Requests"),
+            {"video_id": "abc12345678", "segments": [], "full_text": "ok"},
+        ]
+        result = get_transcript("abc12345678")
+        assert result["full_text"] == "ok"
+        assert mock_fetch.call_count == 2
+
+    @patch("filmot.transcript._fetch_transcript_from_api")
+    def test_direct_route_not_retried_on_unknown_error(self, mock_fetch):
+        mock_fetch.side_effect = Exception("something odd")
+        result = get_transcript("abc12345678")
+        assert result["error"] == "something odd"
+        assert mock_fetch.call_count == 1
+
+    @patch("filmot.transcript._fetch_transcript_from_api")
+    def test_open_breaker_skips_direct_route(self, mock_fetch):
+        for _ in range(transcript_module._primary_breaker.failure_threshold):
+            transcript_module._primary_breaker.record_failure()
+        result = get_transcript("abc12345678")
+        assert "circuit open" in result["error"]
+        mock_fetch.assert_not_called()
+
     @patch("filmot.transcript._fetch_transcript_from_api")
     def test_pool_session_retried_on_transport_error(self, mock_fetch):
         """A transport-class failure on one pool session triggers a retry on the next."""
@@ -200,6 +216,65 @@ class TestGetTranscript:
         assert pool._sessions[0].cooldown_until > 0
         assert pool._sessions[1].success == 1
 
+    @patch("filmot.transcript._fetch_transcript_from_api")
+    def test_repeat_fetch_served_from_cache(self, mock_fetch):
+        """A successful fetch is reused; callers can't mutate the cached copy."""
+        mock_fetch.return_value = {
+            "video_id": "abc12345678",
+            "language": "en",
+            "is_generated": True,
+            "segments": [transcript_module.Segment("Hi", 0.0, 1.0)],
+            "full_text": "Hi",
+            "duration_seconds": 1.0,
+            "segment_count": 1,
+        }
+        first = get_transcript("abc12345678")
+        first["segments"].clear()
+        second = get_transcript("https://youtu.be/abc12345678")
+        assert mock_fetch.call_count == 1
+        assert second["segments"] == [{"text": "Hi", "start": 0.0, "duration": 1.0}]
+
+        get_transcript("abc12345678", languages=["de"])
+        assert mock_fetch.call_count == 2
+
+    @patch("filmot.transcript.get_api")
+    def test_full_text_skipped_then_joined_from_cache(self, mock_get_api):
+        mock_get_api.return_value.fetch.return_value = FakeTranscript(
+            [Seg("Hello\nthere", 0.0, 1.5), Seg("world", 1.5, 1.0)]
+        )
+
+        lean = get_transcript("abc12345678", include_full_text=False)
+        assert "full_text" not in lean
+        assert lean["duration_seconds"] == 2.5
+        full = get_transcript("abc12345678")
+        assert full["full_text"] == "Hello there world"
+        assert mock_get_api.return_value.fetch.call_count == 1
+
+    @patch("filmot.transcript._fetch_transcript_from_api")
+    def test_cache_entries_expire(self, mock_fetch):
+        mock_fetch.return_value = {
+            "video_id": "abc12345678",
+            "language": "en",
+            "is_generated": True,
+            "segments": [],
+            "full_text": "",
+            "duration_seconds": 0,
+            "segment_count": 0,
+        }
+        get_transcript("abc12345678")
+        with patch.object(transcript_module, "_TRANSCRIPT_CACHE_TTL", -1):
+            get_transcript("abc12345678")
+        assert mock_fetch.call_count == 2
+
+    @patch("filmot.transcript._fetch_transcript_from_api")
+    def test_errors_not_cached(self, mock_fetch):
+        from youtube_transcript_api._errors import TranscriptsDisabled
+
+        mock_fetch.side_effect = TranscriptsDisabled("abc12345678")
+        get_transcript("abc12345678")
+        get_transcript("abc12345678")
+        assert mock_fetch.call_count == 2
+
     @patch("filmot.transcript._fetch_transcript_from_api")
     def test_terminal_error_short_circuits_routes(self, mock_fetch):
         """TranscriptsDisabled on the first route stops route iteration."""
@@ -235,55 +310,179 @@ class TestGetTranscript:
         assert mock_fetch.call_count == 1
 
 
-# ── get_transcript_with_fallback ─────────────────────────────────
+# ── async wrappers ───────────────────────────────────────────────
 
-class TestGetTranscriptWithFallback:
-    """Tests for get_transcript_with_fallback()."""
+class TestAsyncFetch:
+    """Tests for get_transcript_async() / get_transcripts_async()."""
 
     @patch("filmot.transcript.get_transcript")
-    def test_youtube_success_no_fallback_needed(self, mock_gt):
-        """When YouTube succeeds, AWS is never called."""
+    def test_gather_preserves_order(self, mock_gt):
+        import asyncio
+
+        mock_gt.side_effect = lambda vid, *a: {"video_id": vid}
+        ids = ["a" * 11, "b" * 11, "c" * 11]
+        results = asyncio.run(transcript_module.get_transcripts_async(ids, max_concurrency=2))
+        assert [r["video_id"] for r in results] == ids
+
+
+# ── search_in_transcript ─────────────────────────────────────────
+
+def _fake_transcript(*texts):
+    return {
+        "video_id": "abc12345678",
+        "language": "en",
+        "is_generated": True,
+        "segments": [Segment(t, float(i * 2), 2.0) for i, t in enumerate(texts)],
+    }
+
+
+class TestSearchInTranscript:
+    """Tests for search_in_transcript() with a stubbed fetch."""
+
+    @patch("filmot.transcript._get_transcript")
+    def test_matches_with_context(self, mock_gt):
+        mock_gt.return_value = _fake_transcript("intro", "the\nfirst", "Python here", "outro", "end")
+        result = search_in_transcript("abc12345678", "python", context_segments=1)
+        assert result["match_count"] == 1
+        match = result["matches"][0]
+        assert match["segment_index"] == 2
+        assert match["timestamp"] == "0:04"
+        assert match["context"] == "the first Python here outro"
+
+    @patch("filmot.transcript._get_transcript")
+    def test_context_clipped_at_edges(self, mock_gt):
+        mock_gt.return_value = _fake_transcript("python start", "middle", "python end")
+        result = search_in_transcript("abc12345678", "PYTHON", context_segments=5)
+        assert [m["context"] for m in result["matches"]] == [
+            "python start middle python end",
+            "python start middle python end",
+        ]
+
+    @patch("filmot.transcript._get_transcript")
+    def test_one_match_per_segment_and_no_straddling(self, mock_gt):
+        mock_gt.return_value = _fake_transcript("spam spam", "ham", "eggs spam", "spam")
+        result = search_in_transcript("abc12345678", "spam", context_segments=0)
+        assert [m["segment_index"] for m in result["matches"]] == [0, 2, 3]
+        assert search_in_transcript("abc12345678", "ham eggs")["match_count"] == 0
+
+    @patch("filmot.transcript._get_transcript")
+    def test_multiple_terms_single_pass(self, mock_gt):
+        mock_gt.return_value = _fake_transcript("deep learning", "nothing", "Neural nets", "learning rate")
+        result = search_in_transcript("abc12345678", ["learning", "neural", "deep learning"])
+        assert [(m["segment_index"], m["term"]) for m in result["matches"]] == [
+            (0, "deep learning"),
+            (2, "neural"),
+            (3, "learning"),
+        ]
+
+    @patch("filmot.transcript._get_transcript")
+    def test_time_range_limits_matches_not_context(self, mock_gt):
+        # Segments start at 0, 2, 4, 6, 8 seconds.
+        mock_gt.return_value = _fake_transcript("spam a", "spam b", "spam c", "spam d", "spam e")
+        result = search_in_transcript(
+            "abc12345678", "spam", context_segments=1, time_range=(2.0, 4.0)
+        )
+        assert [m["segment_index"] for m in result["matches"]] == [1, 2]
+        assert result["matches"][0]["context"] == "spam a spam b spam c"
+        assert result["matches"][1]["context"] == "spam b spam c spam d"
+        assert search_in_transcript("abc12345678", "spam", time_range=(9.0, 20.0))["match_count"] == 0
+
+
+# ── get_transcript_with_timestamps ───────────────────────────────
+
+class TestGetTranscriptWithTimestamps:
+    """Tests for get_transcript_with_timestamps() chunking."""
+
+    @patch("filmot.transcript._get_transcript")
+    def test_chunks_by_start_time(self, mock_gt):
         mock_gt.return_value = {
             "video_id": "abc12345678",
-            "language": "en",
-            "is_generated": True,
-            "segments": [],
-            "full_text": "Hello world",
-            "duration_seconds": 10,
-            "segment_count": 1,
+            "segments": (
+                Segment("a", 10.0, 5.0),
+                Segment("b\nc", 50.0, 5.0),
+                Segment("d", 60.0, 5.0),
+                Segment("e", 185.0, 5.0),
+            ),
         }
-        result = get_transcript_with_fallback("abc12345678")
-        assert result["source"] == "youtube"
-        assert result["full_text"] == "Hello world"
+        result = get_transcript_with_timestamps("abc12345678", chunk_minutes=1)
+        assert [(c["start"], c["start_formatted"], c["text"]) for c in result["chunks"]] == [
+            (0, "0:00", "a b c"),
+            (60, "1:00", "d"),
+            (180, "3:00", "e"),
+        ]
+        assert result["segments"][1] == {"text": "b\nc", "start": 50.0, "duration": 5.0}
 
-    @patch("filmot.transcript.get_transcript")
-    def test_youtube_fails_fallback_disabled(self, mock_gt):
-        """When YouTube fails and fallback is disabled, error is returned."""
-        mock_gt.return_value = {"error": "Transcripts are disabled", "video_id": "abc12345678"}
-        result = get_transcript_with_fallback("abc12345678", use_aws_fallback=False)
-        assert "error" in result
+    @patch("filmot.transcript._get_transcript")
+    def test_first_chunk_labelled_by_its_own_start(self, mock_gt):
+        mock_gt.return_value = {
+            "video_id": "abc12345678",
+            "segments": (Segment("late", 130.0, 5.0), Segment("later", 150.0, 5.0)),
+        }
+        result = get_transcript_with_timestamps("abc12345678", chunk_minutes=1)
+        assert [(c["start_formatted"], c["text"]) for c in result["chunks"]] == [
+            ("2:00", "late later"),
+        ]
 
-    @patch("filmot.transcript.get_transcript")
-    @patch("filmot.aws_transcribe.check_dependencies")
-    @patch("filmot.aws_transcribe.transcribe_video")
-    def test_youtube_fails_aws_succeeds(self, mock_transcribe, mock_deps, mock_gt):
-        """When YouTube fails, AWS Transcribe fallback kicks in."""
-        mock_gt.return_value = {"error": "Transcripts are disabled", "video_id": "abc12345678"}
-        mock_deps.return_value = (True, "")
-        mock_transcribe.return_value = ("AWS transcript text here", "en-US")
-
-        result = get_transcript_with_fallback("abc12345678", use_aws_fallback=True)
-        assert result["source"] == "aws_transcribe"
-        assert result["full_text"] == "AWS transcript text here"
-        assert result["language"] == "en-US"
 
-    @patch("filmot.transcript.get_transcript")
-    @patch("filmot.aws_transcribe.check_dependencies")
-    def test_aws_deps_missing(self, mock_deps, mock_gt):
-        """When AWS deps are missing, returns combined error."""
-        mock_gt.return_value = {"error": "Transcripts are disabled", "video_id": "abc12345678"}
-        mock_deps.return_value = (False, "boto3 not installed")
+# ── HTTP clients ─────────────────────────────────────────────────
 
-        result = get_transcript_with_fallback("abc12345678", use_aws_fallback=True)
-        assert "error" in result
-        assert "boto3" in result["error"]
+class TestHttpClients:
+    """Tests for connection reuse across transcript clients."""
+
+    def test_pool_client_reused_per_proxy_url(self):
+        a = transcript_module._pool_client("http://u1:p1@p.webshare.io:80")
+        b = transcript_module._pool_client("http://u1:p1@p.webshare.io:80")
+        c = transcript_module._pool_client("http://u2:p2@p.webshare.io:80")
+        assert a is b
+        assert a is not c
+
+    def test_sessions_mount_pooled_adapter(self):
+        session = transcript_module._new_http_session()
+        adapter = session.get_adapter("https://www.youtube.com/")
+        assert adapter._pool_maxsize == transcript_module._HTTP_POOL_SIZE
+
+
+# ── get_transcript_with_fallback ─────────────────────────────────
+
+class TestGetTranscriptWithFallback:
+    """Tests for get_transcript_with_fallback()."""
+
+    YT_OK = {
+        "video_id": "abc12345678",
+        "language": "en",
+        "is_generated": True,
+        "segments": [],
+        "full_text": "Hello world",
+        "duration_seconds": 10,
+        "segment_count": 1,
+    }
+    YT_DISABLED = {"error": "Transcripts are disabled", "video_id": "abc12345678"}
+
+    @pytest.mark.parametrize("yt_result, use_aws, deps, aws_result, expected, error", [
+        # YouTube succeeds: AWS is never called
+        (YT_OK, True, (True, ""), None,
+         {"source": "youtube", "full_text": "Hello world"}, None),
+        # YouTube fails and fallback is disabled: error is returned
+        (YT_DISABLED, False, (True, ""), None, {}, "disabled"),
+        # YouTube fails: AWS Transcribe fallback kicks in
+        (YT_DISABLED, True, (True, ""), ("AWS transcript text here", "en-US"),
+         {"source": "aws_transcribe", "full_text": "AWS transcript text here", "language": "en-US"},
+         None),
+        # AWS deps missing: combined error
+        (YT_DISABLED, True, (False, "boto3 not installed"), None, {}, "boto3"),
+    ], ids=["youtube_success", "fallback_disabled", "aws_succeeds", "aws_deps_missing"])
+    def test_fallback(self, monkeypatch, yt_result, use_aws, deps, aws_result, expected, error):
+        monkeypatch.setattr("filmot.transcript.get_transcript", MagicMock(return_value=dict(yt_result)))
+        monkeypatch.setattr("filmot.aws_transcribe.check_dependencies", MagicMock(return_value=deps))
+        mock_transcribe = MagicMock(return_value=aws_result)
+        monkeypatch.setattr("filmot.aws_transcribe.transcribe_video", mock_transcribe)
+
+        result = get_transcript_with_fallback("abc12345678", use_aws_fallback=use_aws)
+
+        for key, value in expected.items():
+            assert result[key] == value
+        if error:
+            assert error in result["error"]
+        else:
+            assert "error" not in result
+        assert mock_transcribe.called == (aws_result is not None)
@@ -0,0 +1,165 @@
+"""Tests for filmot.watchlist module."""
+
+import json
+
+import pytest
+
+from filmot.watchlist import Watchlist
+
+
+@pytest.fixture
+def watchlist(tmp_path):
+    """Provide a Watchlist backed by a temp directory."""
+    return Watchlist(storage_dir=str(tmp_path / ".filmot_data"))
+
+
+def _video(video_id, title="A video"):
+    return {"id": video_id, "title": title, "channelname": "Chan", "viewcount": 10}
+
+
+def _reload(watchlist):
+    return Watchlist(storage_dir=str(watchlist.storage_dir))
+
+
+# ── Videos and indexes ────────────────────────────────────────────
+
+class TestVideos:
+    """Tests for add/remove/tag and the in-memory indexes."""
+
+    def test_add_rejects_duplicate(self, watchlist):
+        assert watchlist.add_video(_video("abc12345678")) is True
+        assert watchlist.add_video(_video("abc12345678")) is False
+        assert len(watchlist.get_watchlist()) == 1
+
+    def test_indexes_follow_add_tag_remove(self, watchlist):
+        watchlist.add_video(_video("abc12345678"))
+        watchlist.add_video(_video("def12345678"))
+        assert watchlist.add_tag("abc12345678", "ml")
+        assert watchlist.add_tag("def12345678", "ml")
+        assert not watchlist.add_tag("zzz12345678", "ml")
+        assert {i["video_id"] for i in watchlist.get_watchlist(tag="ml")} == {
+            "abc12345678", "def12345678",
+        }
+
+        assert watchlist.remove_video("abc12345678")
+        assert not watchlist.remove_video("abc12345678")
+        assert [i["video_id"] for i in watchlist.get_watchlist(tag="ml")] == ["def12345678"]
+        assert watchlist.mark_watched("abc12345678") is False
+
+        watchlist.remove_video("def12345678")
+        assert watchlist.get_watchlist(tag="ml") == []
+        assert watchlist.stats()["tags"] == []
+
+    def test_tag_filter_keeps_list_order(self, watchlist):
+        for vid in ("aaa12345678", "bbb12345678", "ccc12345678"):
+            watchlist.add_video(_video(vid))
+        watchlist.add_tag("ccc12345678", "ml")
+        watchlist.add_tag("aaa12345678", "ml")
+        assert [i["video_id"] for i in watchlist.get_watchlist(tag="ml")] == [
+            "aaa12345678", "ccc12345678",
+        ]
+
+    def test_state_survives_reload(self, watchlist):
+        watchlist.add_video(_video("abc12345678"))
+        watchlist.add_tag("abc12345678", "ml")
+        watchlist.mark_watched("abc12345678")
+        reloaded = _reload(watchlist)
+        assert [i["video_id"] for i in reloaded.get_watchlist(tag="ml", watched=True)] == [
+            "abc12345678",
+        ]
+
+    def test_remove_drops_duplicate_entries(self, watchlist):
+        item = {"video_id": "abc12345678", "title": "dup", "tags": ["ml"]}
+        watchlist.watchlist_file.write_text(json.dumps({"items": [item, dict(item)]}))
+        assert watchlist.remove_video("abc12345678")
+        assert watchlist.get_watchlist() == []
+        assert _reload(watchlist).get_watchlist() == []
+
+
+# ── batch() ───────────────────────────────────────────────────────
+
+class TestBatch:
+    """Tests for deferred writes inside batch()."""
+
+    def test_writes_file_once(self, watchlist, monkeypatch):
+        writes = []
+        save_file = watchlist._save_file
+        monkeypatch.setattr(
+            watchlist, "_save_file", lambda path, data: (writes.append(path), save_file(path, data))
+        )
+        with watchlist.batch():
+            for i in range(5):
+                watchlist.add_video(_video(f"vid{i:08d}"))
+            watchlist.add_tag("vid00000000", "ml")
+            assert writes == []
+        assert writes == [watchlist.watchlist_file]
+        assert len(_reload(watchlist).get_watchlist()) == 5
+
+    def test_entries_share_one_timestamp(self, watchlist):
+        with watchlist.batch():
+            watchlist.add_video(_video("abc12345678"))
+            watchlist.add_video(_video("def12345678"))
+        stamps = {i["added_at"] for i in watchlist.get_watchlist()}
+        assert len(stamps) == 1
+
+
+# ── Saved searches ────────────────────────────────────────────────
+
+class TestSavedSearches:
+    """Tests for saved searches and their result side files."""
+
+    def test_results_round_trip_through_side_file(self, watchlist):
+        results = {"result": [{"id": "abc12345678"}, {"id": "def12345678"}]}
+        watchlist.save_search("ml talks", "machine learning", {"lang": "en"}, results)
+        assert "results" not in watchlist.saved_searches_file.read_text()
+
+        reloaded = _reload(watchlist)
+        assert reloaded.list_saved_searches()[0]["result_count"] == 2
+        assert reloaded.get_saved_search("ml talks")["results"] == results
+
+    def test_delete_removes_side_file(self, watchlist):
+        watchlist.save_search("ml", "machine learning", {}, {"result": []})
+        path = watchlist._results_path("ml")
+        assert path.exists()
+        assert watchlist.delete_saved_search("ml")
+        assert not path.exists()
+        assert watchlist.get_saved_search("ml") is None
+        assert not watchlist.delete_saved_search("ml")
+
+    def test_resave_updates_in_place(self, watchlist):
+        watchlist.save_search("a", "first", {})
+        watchlist.save_search("b", "other", {})
+        watchlist.save_search("a", "second", {})
+        assert [s["query"] for s in watchlist.list_saved_searches()] == ["second", "other"]
+
+    def test_legacy_inline_results_load(self, watchlist):
+        legacy = {"items": [{
+            "name": "old",
+            "query": "q",
+            "params": {},
+            "saved_at": "2024-01-01T00:00:00",
+            "result_count": 1,
+            "results": {"result": [{"id": "abc12345678"}]},
+        }]}
+        watchlist.saved_searches_file.write_text(json.dumps(legacy))
+        assert watchlist.get_saved_search("old")["results"] == {"result": [{"id": "abc12345678"}]}
+
+
+# ── Lazy loading ──────────────────────────────────────────────────
+
+class TestLazyLoad:
+    """Tests that each file is parsed only when first needed."""
+
+    def test_files_load_on_first_access(self, watchlist):
+        watchlist.add_video(_video("abc12345678"))
+        watchlist.save_search("s", "q", {})
+
+        fresh = _reload(watchlist)
+        assert fresh._watchlist_data is None
+        assert fresh._saved_searches_data is None
+
+        assert len(fresh.list_saved_searches()) == 1
+        assert fresh._watchlist_data is None
+
+        assert len(fresh.get_watchlist()) == 1
+        assert fresh._watchlist_data is not None
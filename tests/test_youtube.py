@@ -0,0 +1,85 @@
+"""Tests for filmot.youtube module (no network)."""
+
+import pytest
+
+import filmot.youtube as youtube
+from filmot.youtube import search_with_transcript
+
+
+def _item(video_id):
+    return {
+        "id": video_id,
+        "snippet": {
+            "title": f"Title {video_id}",
+            "channelTitle": "Chan",
+            "channelId": "UC1",
+            "publishedAt": "2024-01-01T00:00:00Z",
+        },
+        "statistics": {"viewCount": "5"},
+    }
+
+
+@pytest.fixture
+def fake_youtube(monkeypatch):
+    """Stub the REST calls; search returns ``ids``, videos returns ``detail_ids`` reversed."""
+    monkeypatch.setattr(youtube, "get_youtube_api_key", lambda: "test-key")
+
+    def install(ids, detail_ids=None):
+        detail_ids = ids if detail_ids is None else detail_ids
+
+        def _api_get(url, endpoint, params, cache_key=None):
+            if endpoint == "search":
+                return {"items": [{"id": {"videoId": vid}} for vid in ids]}
+            return {"items": [_item(vid) for vid in reversed(detail_ids)]}
+
+        monkeypatch.setattr(youtube, "_api_get", _api_get)
+
+    return install
+
+
+# ── search_with_transcript ────────────────────────────────────────
+
+class TestSearchWithTranscript:
+    """Tests for the concurrent transcript fan-out."""
+
+    def test_results_in_search_order_with_matches(self, fake_youtube, monkeypatch):
+        ids = ["vid00000000", "vid00000001", "vid00000002"]
+        fake_youtube(ids)
+        monkeypatch.setattr(
+            "filmot.transcript.search_in_transcript",
+            lambda vid, term: {"matches": [f"{term} in {vid}"], "match_count": 1},
+        )
+
+        videos = search_with_transcript("q", transcript_query="needle")
+
+        assert [v["video_id"] for v in videos] == ids
+        assert videos[1]["transcript_matches"] == ["needle in vid00000001"]
+        assert all(v["transcript_match_count"] == 1 for v in videos)
+
+    def test_failed_transcript_degrades_to_no_matches(self, fake_youtube, monkeypatch):
+        fake_youtube(["vid00000000", "vid00000001"])
+
+        def search(vid, term):
+            if vid == "vid00000000":
+                raise RuntimeError("blocked")
+            return {"matches": ["hit"], "match_count": 1}
+
+        monkeypatch.setattr("filmot.transcript.search_in_transcript", search)
+        videos = search_with_transcript("q")
+        assert videos[0]["transcript_matches"] == []
+        assert videos[0]["transcript_match_count"] == 0
+        assert videos[1]["transcript_match_count"] == 1
+
+    def test_videos_missing_from_details_are_skipped(self, fake_youtube, monkeypatch):
+        fake_youtube(["vid00000000", "gone0000000", "vid00000002"],
+                     detail_ids=["vid00000000", "vid00000002"])
+        monkeypatch.setattr(
+            "filmot.transcript.search_in_transcript",
+            lambda vid, term: {"matches": [], "match_count": 0},
+        )
+        videos = search_with_transcript("q")
+        assert [v["video_id"] for v in videos] == ["vid00000000", "vid00000002"]
+
+    def test_no_search_hits(self, fake_youtube):
+        fake_youtube([])
+        assert search_with_transcript("q") == []
@@ -0,0 +1,204 @@
+"""Tests for filmot.youtube_search module (no network)."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+import filmot.youtube_search as ys
+from filmot.youtube_search import format_duration, get_video_details, search_videos
+
+
+# ── format_duration ───────────────────────────────────────────────
+
+class TestFormatDuration:
+    """Tests for format_duration()."""
+
+    @pytest.mark.parametrize("iso, expected", [
+        ("PT1H2M3S", "1h 2m"),
+        ("PT2H", "2h 0m"),
+        ("PT4M", "4m 0s"),
+        ("PT12M30S", "12m 30s"),
+        ("PT59S", "59s"),
+        ("PT0S", "0s"),
+    ])
+    def test_formats(self, iso, expected):
+        assert format_duration(iso) == expected
+
+    def test_non_pt_returned_as_is(self):
+        assert format_duration("P1DT2H") == "P1DT2H"
+        assert format_duration("") == ""
+
+
+# ── Paging / batching ─────────────────────────────────────────────
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Route _api_get to a callable; records (endpoint, params) per call."""
+    calls = []
+    monkeypatch.setattr(ys, "YOUTUBE_API_KEY", "test-key")
+
+    def install(handler):
+        def _api_get(url, endpoint, params, cache_key=None):
+            calls.append((endpoint, dict(params)))
+            return handler(endpoint, params)
+        monkeypatch.setattr(ys, "_api_get", _api_get)
+        return calls
+
+    return install
+
+
+class TestSearchPaging:
+    """Tests for search_videos() past the 50-per-page limit."""
+
+    def test_follows_page_tokens(self, fake_api):
+        def handler(endpoint, params):
+            page = int(params.get("pageToken", "0"))
+            n = params["maxResults"]
+            items = [{"id": {"videoId": f"v{page * 50 + i:010d}"}} for i in range(n)]
+            return {"items": items, "nextPageToken": str(page + 1)}
+
+        calls = fake_api(handler)
+        videos = search_videos("q", max_results=120)
+        assert len(videos) == 120
+        assert [c[1]["maxResults"] for c in calls] == [50, 50, 20]
+        assert "pageToken" not in calls[0][1]
+
+    def test_stops_without_next_token(self, fake_api):
+        calls = fake_api(lambda e, p: {"items": [{"id": {"videoId": "abc12345678"}}]})
+        assert len(search_videos("q", max_results=200)) == 1
+        assert len(calls) == 1
+
+
+class TestVideoDetailBatches:
+    """Tests for get_video_details() batching."""
+
+    def test_batches_of_fifty_in_input_order(self, fake_api):
+        def handler(endpoint, params):
+            ids = params["id"].split(",")
+            return {"items": [{"id": vid} for vid in reversed(ids)]}
+
+        calls = fake_api(handler)
+        ids = [f"id{i:09d}" for i in range(120)]
+        videos = get_video_details(ids)
+        assert [v["video_id"] for v in videos] == ids
+        assert sorted(len(c[1]["id"].split(",")) for c in calls) == [20, 50, 50]
+
+    def test_empty_input_makes_no_request(self, fake_api):
+        calls = fake_api(lambda e, p: {"items": []})
+        assert get_video_details([]) == []
+        assert calls == []
+
+
+class TestSearchFilters:
+    """Tests for keyword filter translation in search_videos()."""
+
+    def test_set_filters_become_api_params(self, fake_api):
+        calls = fake_api(lambda e, p: {"items": []})
+        search_videos("q", channel_id="UC1", video_duration="long",
+                      safe_search=None, location="1,2")
+        params = calls[0][1]
+        assert params["channelId"] == "UC1"
+        assert params["videoDuration"] == "long"
+        assert "safeSearch" not in params
+        assert params["locationRadius"] == "50km"
+
+    def test_datetime_bounds_formatted_as_rfc3339(self, fake_api):
+        calls = fake_api(lambda e, p: {"items": []})
+        search_videos("q", published_after=datetime(2024, 1, 31, 9, 5, 7, 123456))
+        assert calls[0][1]["publishedAfter"] == "2024-01-31T09:05:07Z"
+
+
+# ── Metadata cache / ETags ────────────────────────────────────────
+
+class _FakeResponse:
+    def __init__(self, status_code, body=None, etag=None):
+        self.status_code = status_code
+        self._body = body or {}
+        self.content = json.dumps(self._body).encode()
+        self.headers = {"ETag": etag} if etag else {}
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, headers=None):
+        self.calls.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def api_env(monkeypatch, tmp_path):
+    """Real _api_get over a temp cache, a fake session and a settable clock."""
+    now = [1_000_000.0]
+    monkeypatch.setattr("time.time", lambda: now[0])
+    monkeypatch.setattr(ys, "YOUTUBE_CACHE_TTL", 60)
+    monkeypatch.setattr(ys, "YOUTUBE_CACHE_DIR", str(tmp_path / "yt"))
+    monkeypatch.setattr(ys, "_metadata_cache", None)
+    monkeypatch.setattr(ys, "acquire_youtube_quota", lambda endpoint: 0.0)
+
+    def install(*responses):
+        session = _FakeSession(responses)
+        monkeypatch.setattr(ys, "_session", session)
+        return session
+
+    return install, now
+
+
+class TestApiCache:
+    """Tests for _api_get's disk cache and ETag revalidation."""
+
+    def _get(self):
+        return ys._api_get(ys.YOUTUBE_VIDEOS_URL, "videos", {"key": "k", "id": "abc12345678"})
+
+    def test_fresh_entry_skips_request(self, api_env):
+        install, now = api_env
+        session = install(_FakeResponse(200, {"items": [1]}, etag="e1"))
+        assert self._get() == {"items": [1]}
+        now[0] += 30
+        assert self._get() == {"items": [1]}
+        assert len(session.calls) == 1
+
+    def test_stale_entry_revalidates_and_304_restarts_ttl(self, api_env):
+        install, now = api_env
+        session = install(
+            _FakeResponse(200, {"items": [1]}, etag="e1"),
+            _FakeResponse(304),
+        )
+        self._get()
+        now[0] += 120
+        assert self._get() == {"items": [1]}
+        assert session.calls[1] == {"If-None-Match": "e1"}
+        now[0] += 30
+        assert self._get() == {"items": [1]}
+        assert len(session.calls) == 2
+
+    def test_changed_body_replaces_entry(self, api_env):
+        install, now = api_env
+        install(
+            _FakeResponse(200, {"items": [1]}, etag="e1"),
+            _FakeResponse(200, {"items": [2]}, etag="e2"),
+        )
+        self._get()
+        now[0] += 120
+        assert self._get() == {"items": [2]}
+        assert self._get() == {"items": [2]}
+
+    def test_zero_ttl_disables_cache(self, api_env, monkeypatch):
+        install, _ = api_env
+        monkeypatch.setattr(ys, "YOUTUBE_CACHE_TTL", 0)
+        session = install(
+            _FakeResponse(200, {"items": [1]}, etag="e1"),
+            _FakeResponse(200, {"items": [1]}, etag="e1"),
+        )
+        self._get()
+        self._get()
+        assert session.calls == [{}, {}]